@@ -5,17 +5,26 @@ Specialized for Green Power market intelligence with Signal/Risk analysis framew
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+import xlsxwriter
 import json
-import time
-from datetime import datetime
+import hashlib
+from datetime import datetime, timedelta
+import asyncio
 import logging
 import os
+import time
+import re
 from typing import Dict, List, Any, Tuple
 import openai
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 from pathlib import Path
+from string import Template
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 # Google Sheets integration
 try:
@@ -27,6 +36,41 @@ except ImportError:
     GOOGLE_SHEETS_AVAILABLE = False
     print("⚠️  Google Sheets integration not available. Install with: pip install gspread google-auth")
 
+# HTTP response caching (optional): unchanged pages are revalidated with conditional GETs
+try:
+    from requests_cache import CachedSession
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    HTTP_CACHE_AVAILABLE = False
+
+# Brotli decoding (optional): urllib3 can only decode 'br' bodies when brotli is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Fast JSON encoding (optional): orjson serializes straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Compression for archived raw data (optional)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Vector math for the semantic LLM cache (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -60,20 +104,205 @@ create_directories()
 logger = setup_logging()
 logger.info("Created organized directory structure")
 
+# XPath equivalents of the news selectors, unioned into one expression so the tree is
+# walked once and matches come back deduplicated in document order. The .article,
+# .story, .post and .featured-article class selectors are covered by the substring
+# matches below.
+NEWS_XPATH = etree.XPath(' | '.join((
+    "//article",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' entry ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' news-item ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' content-item ')]",
+    "//*[contains(@class, 'article')]",
+    "//*[contains(@class, 'story')]",
+    "//*[contains(@class, 'post')]",
+    "//h1", "//h2", "//h3"
+)))
+HEADINGS_XPATH = etree.XPath("//h1 | //h2 | //h3")
+# First h1-h5 heading inside a news item, evaluated relative to that item
+HEAD_XPATH = etree.XPath("(.//h1 | .//h2 | .//h3 | .//h4 | .//h5)[1]")
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace to single spaces and trim the ends"""
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+def dump_json_bytes(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when available
+
+    Both paths give the same bytes for the str/int/bool/None/list/dict payloads this
+    module writes; floats may be formatted differently (1e20 vs 1e+20), and NaN or
+    Infinity become null with orjson but NaN/Infinity with the json fallback.
+    """
+    if ORJSON_AVAILABLE:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    separators = (',', ': ') if indent else (',', ':')
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys,
+                      ensure_ascii=False, separators=separators).encode('utf-8')
+
+def write_atomic(path: str, data: bytes):
+    """Write data to path via a temporary file and rename, so a crash never leaves a partial file"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def compile_keyword_pattern(keywords: List[str]) -> 're.Pattern':
+    """Compile keywords into one lookahead alternation, longest first; scan it with find_keywords"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))')
+
+def find_keywords(text_lower: str, keywords: List[str], pattern: 're.Pattern') -> set:
+    """Return every keyword in text_lower from one scan of its compile_keyword_pattern
+
+    The alternation only reports the longest keyword starting at each position, so
+    keywords that are a prefix of it ("solar" in "solar power") are added back.
+    """
+    hits = set(pattern.findall(text_lower))
+    return {keyword for keyword in keywords if any(hit.startswith(keyword) for hit in hits)}
+
+def match_signal_sentences(sentences: List[str], sentence_lowers: List[str],
+                           keywords: List[str], pattern: 're.Pattern') -> List[str]:
+    """Return the first qualifying sentence for each keyword, in keyword order"""
+    first_match = {}
+    for sentence, sentence_lower in zip(sentences, sentence_lowers):
+        if not 20 < len(sentence) < 300:
+            continue
+        found = [keyword for keyword in find_keywords(sentence_lower, keywords, pattern)
+                 if keyword not in first_match]
+        if found:
+            clean_sentence = normalize_whitespace(sentence)
+            if len(clean_sentence) > 20:
+                for keyword in found:
+                    first_match.setdefault(keyword, clean_sentence)
+                if len(first_match) == len(keywords):
+                    break
+    return [first_match[keyword] for keyword in keywords if keyword in first_match]
+
+DIGIT_RE = re.compile(r'\d')
+
+# Navigation and boilerplate words that disqualify a headline
+SKIP_RE = re.compile('menu|navigation|search|close|skip|subscribe|newsletter', re.IGNORECASE)
+
+# Keywords relevant to Infineon's hybrid AI industrial strategy; texts that had to be
+# truncated only need to match the narrower core set
+CORE_KEYWORDS = (
+    'ai', 'artificial intelligence', 'industrial', 'manufacturing', 'automation',
+    'predictive maintenance', 'edge computing', 'iot', 'smart', 'efficiency',
+    'reliability', 'sustainability', 'semiconductor', 'chip', 'power'
+)
+RELEVANT_KEYWORDS = CORE_KEYWORDS + (
+    'motor', 'drive', 'equipment', 'optimization', 'machine learning',
+    'energy', 'electricity', 'renewable', 'solar', 'wind', 'battery',
+    'emission', 'carbon', 'clean', 'transition', 'investment', 'market',
+    'technology', 'research', 'production', 'factory', 'industry'
+)
+CORE_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in CORE_KEYWORDS), re.IGNORECASE)
+RELEVANT_KEYWORDS_RE = re.compile('|'.join(re.escape(keyword) for keyword in RELEVANT_KEYWORDS), re.IGNORECASE)
+
+# Common web artifacts and navigation labels stripped from scraped text; words are
+# joined with \s+ so the pattern also matches before whitespace is collapsed
+ARTIFACTS = (
+    'Toggle filter', 'Chevron down', 'Read documentation', 'cross',
+    'Back to homepage', 'Contact Us', 'Useful links', 'Latest insights',
+    'Latest updates', 'Open data', 'About us', 'Careers',
+    'Toggle navigation', 'My User', 'Create account', 'Log in',
+    'View form', 'View source', 'History', 'Refresh', 'What links here',
+    'Browse Properties', 'From Open Energy Information'
+)
+ARTIFACTS_RE = re.compile('|'.join(r'\s+'.join(map(re.escape, artifact.split())) for artifact in ARTIFACTS))
+
+# Per-source scraping configuration: candidate URLs in priority order, keywords that
+# make a statistic a key insight, and keywords that surface market signals
+SOURCE_CONFIGS = {
+    'canary': {
+        'name': 'Canary Media',
+        'focus': 'clean energy insights',
+        'urls': [
+            'https://www.canarymedia.com/',
+            'https://www.canarymedia.com/articles',
+            'https://www.canarymedia.com/news',
+            'https://www.canarymedia.com/energy'
+        ],
+        'insight_keywords': ['energy', 'electricity', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'clean', 'transition'],
+        'signal_keywords': ['renewable', 'solar', 'wind', 'battery', 'electric vehicle', 'green energy', 'carbon', 'emission', 'transition', 'clean energy']
+    },
+    'industryweek': {
+        'name': 'Industry Week',
+        'focus': 'manufacturing insights',
+        'urls': [
+            'https://www.industryweek.com/',
+            'https://www.industryweek.com/news',
+            'https://www.industryweek.com/technology',
+            'https://www.industryweek.com/operations'
+        ],
+        'insight_keywords': ['manufacturing', 'production', 'automation', 'technology', 'industry', 'supply chain', 'efficiency', 'productivity'],
+        'signal_keywords': ['manufacturing', 'production', 'automation', 'technology', 'industry', 'supply chain', 'efficiency', 'productivity', 'semiconductor', 'automotive']
+    },
+    'eia': {
+        'name': 'EIA Today in Energy',
+        'focus': 'energy market insights',
+        'urls': [
+            'https://www.eia.gov/todayinenergy/',
+            'https://www.eia.gov/todayinenergy/index.php',
+            'https://www.eia.gov/outlooks/steo/',
+            'https://www.eia.gov/'
+        ],
+        'insight_keywords': ['energy', 'electricity', 'oil', 'gas', 'coal', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'consumption', 'production'],
+        'signal_keywords': ['energy', 'electricity', 'oil', 'gas', 'coal', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'consumption', 'production', 'market', 'price']
+    }
+}
+for _config in SOURCE_CONFIGS.values():
+    _config['insight_pattern'] = re.compile('|'.join(re.escape(keyword) for keyword in _config['insight_keywords']))
+    _config['signal_pattern'] = compile_keyword_pattern(_config['signal_keywords'])
+
 class ConfigurableIntelligenceScraper:
     """Configurable scraper for competitive intelligence sources"""
     
     def __init__(self):
-        self.session = requests.Session()
+        if HTTP_CACHE_AVAILABLE:
+            # Honour ETag/Last-Modified so pages that haven't changed since the last run
+            # come back as 304s and are served from the local cache
+            self.session = CachedSession(
+                'data/http_cache',
+                backend='sqlite',
+                expire_after=1800,
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Connection': 'keep-alive',
+            # Ask for the smallest encoding we can decode; brotli bodies are usually
+            # noticeably smaller than gzip for HTML
+            'Accept-Encoding': 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate'
         })
+        
+        # Pool connections per host so fallback probes reuse the TCP/TLS session
+        # instead of paying a fresh handshake for every candidate URL
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.data = {}
         
         # Import configuration
         try:
             from intelligence_sources_config import get_enabled_sources
-            self.sources = get_enabled_sources()
+            # Copy the shared read-only mapping, since add_source/remove_source edit it
+            self.sources = dict(get_enabled_sources())
         except ImportError:
             # Fallback to default sources if config not available
             self.sources = {
@@ -101,375 +330,493 @@ class ConfigurableIntelligenceScraper:
             'url': url,
             'description': description
         }
-        logger.info(f"Added new source: {name} ({url})")
+        logger.info("Added new source: %s (%s)", name, url)
     
     def remove_source(self, key: str):
         """Remove a source from the scraper"""
         if key in self.sources:
             removed = self.sources.pop(key)
-            logger.info(f"Removed source: {removed['name']}")
+            logger.info("Removed source: %s", removed['name'])
         else:
-            logger.warning(f"Source {key} not found")
+            logger.warning("Source %s not found", key)
     
     def list_sources(self):
         """List all configured sources"""
         logger.info("Configured sources:")
         for key, source in self.sources.items():
-            logger.info(f"  {key}: {source['name']} - {source['url']}")
+            logger.info("  %s: %s - %s", key, source['name'], source['url'])
     
-    def scrape_canary(self) -> Dict[str, Any]:
-        """Scrape Canary Media for clean energy news and analysis"""
-        logger.info("Scraping Canary Media for clean energy insights...")
+    def _scrape_generic(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Scrape one source described by a SOURCE_CONFIGS entry"""
+        logger.info("Scraping %s for %s...", config['name'], config['focus'])
         try:
-            # Try to find news/articles page
-            news_urls = [
-                'https://www.canarymedia.com/',
-                'https://www.canarymedia.com/articles',
-                'https://www.canarymedia.com/news',
-                'https://www.canarymedia.com/energy'
-            ]
-            
             data = {
-                'source': 'Canary Media',
+                'source': config['name'],
                 'timestamp': datetime.now().isoformat(),
                 'url': '',
                 'headlines': [],
                 'key_insights': [],
                 'market_signals': []
             }
+            # Dicts used as insertion-ordered sets: the union selector and the
+            # keyword scans can surface the same text more than once
+            headlines, insights, signals = {}, {}, {}
             
-            for url in news_urls:
+            # Try the candidate news/articles pages in priority order; a fallback is
+            # only requested once the previous candidate failed or had no content
+            for url in config['urls']:
                 try:
                     response = self.session.get(url, timeout=10)
                     response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
+                    # Parse the decoded body; the HTTP cache has already read the raw
+                    # stream to store it, so it cannot be streamed into lxml
+                    tree = lxml_html.fromstring(response.content)
+                    # Drop scripts, styles and navigation chrome so none of it leaks into
+                    # the headlines or the page content
+                    etree.strip_elements(tree, 'script', 'style', 'nav', 'footer', with_tail=False)
                     data['url'] = url
                     
                     # Look for news articles, stories, recent content
-                    news_selectors = [
-                        'article', '.article', '.story', '.post', '.entry',
-                        '.news-item', '.content-item', '.featured-article',
-                        '[class*="article"]', '[class*="story"]', '[class*="post"]',
-                        'h1', 'h2', 'h3'
-                    ]
-                    
-                    news_items = []
-                    for selector in news_selectors:
-                        items = soup.select(selector)
-                        if items:
-                            news_items.extend(items)
+                    news_items = NEWS_XPATH(tree)
                     
                     # Extract headlines from news items
                     for item in news_items[:10]:  # Limit to first 10 items
                         # Look for headline text
-                        headline_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                        if headline_elem:
-                            text = headline_elem.text.strip()
-                            text = ' '.join(text.split())
+                        match = HEAD_XPATH(item)
+                        headline_elem = match[0] if match else None
+                        if headline_elem is not None:
+                            text = normalize_whitespace(headline_elem.text_content())
                             if text and len(text) > 10 and len(text) < 200:
                                 # Filter out navigation and common web elements
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
+                                if not SKIP_RE.search(text):
+                                    headlines.setdefault(text, None)
                     
                     # If no headlines found, try general content extraction
-                    if not data['headlines']:
-                        headlines = soup.find_all(['h1', 'h2', 'h3'], limit=10)
-                        for headline in headlines:
-                            text = headline.text.strip()
-                            text = ' '.join(text.split())
+                    if not headlines:
+                        for headline in HEADINGS_XPATH(tree)[:10]:
+                            text = normalize_whitespace(headline.text_content())
                             if text and len(text) > 10 and len(text) < 200:
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
+                                if not SKIP_RE.search(text):
+                                    headlines.setdefault(text, None)
                     
-                    # Extract key insights from news content
-                    content = soup.get_text()
+                    # Extract key insights from the news containers rather than the whole page;
+                    # nested matches are skipped so each subtree's text is read only once
+                    containers = set(news_items)
+                    roots = [item for item in news_items
+                             if not any(ancestor in containers for ancestor in item.iterancestors())]
+                    # Text nodes are joined with a space so neighbouring block elements
+                    # don't run together ("across US" + "Solar ..." -> "across USSolar")
+                    content = normalize_whitespace(' '.join(
+                        text for root in (roots or [tree]) for text in root.itertext()))
                     
-                    # Look for numbers and statistics in context
-                    sentences = content.split('.')
-                    for sentence in sentences:
-                        sentence = sentence.strip()
-                        if any(char.isdigit() for char in sentence) and 20 < len(sentence) < 300:
-                            # Look for clean energy related statistics
-                            energy_keywords = ['energy', 'electricity', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'clean', 'transition']
-                            if any(keyword in sentence.lower() for keyword in energy_keywords):
-                                clean_sentence = ' '.join(sentence.split())
+                    # Split and lowercase the page once; the keyword scans below reuse these
+                    sentences = [sentence.strip() for sentence in content.split('.')]
+                    sentence_lowers = [sentence.lower() for sentence in sentences]
+                    
+                    # Look for numbers and statistics in context; the cheap length test
+                    # runs first and the digit scan happens in the C regex engine
+                    insight_pattern = config['insight_pattern']
+                    for sentence, sentence_lower in zip(sentences, sentence_lowers):
+                        if 20 < len(sentence) < 300 and DIGIT_RE.search(sentence):
+                            if insight_pattern.search(sentence_lower):
+                                clean_sentence = normalize_whitespace(sentence)
                                 if len(clean_sentence) > 20:
-                                    data['key_insights'].append(clean_sentence)
+                                    insights.setdefault(clean_sentence, None)
                     
                     # Extract market signals from recent news
-                    clean_energy_keywords = ['renewable', 'solar', 'wind', 'battery', 'electric vehicle', 'green energy', 'carbon', 'emission', 'transition', 'clean energy']
-                    for keyword in clean_energy_keywords:
-                        if keyword.lower() in content.lower():
-                            sentences = content.split('.')
-                            for sentence in sentences:
-                                sentence = sentence.strip()
-                                if keyword.lower() in sentence.lower() and 20 < len(sentence) < 300:
-                                    clean_sentence = ' '.join(sentence.split())
-                                    if len(clean_sentence) > 20:
-                                        data['market_signals'].append(clean_sentence)
-                                        break
+                    signals.update(dict.fromkeys(match_signal_sentences(
+                        sentences, sentence_lowers, config['signal_keywords'], config['signal_pattern'])))
                     
-                    if data['headlines'] or data['key_insights'] or data['market_signals']:
+                    if headlines or insights or signals:
                         break
                         
                 except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
+                    logger.warning("Failed to scrape %s: %s", url, e)
                     continue
             
             # Limit results to avoid token limits
-            data['headlines'] = data['headlines'][:5]
-            data['key_insights'] = data['key_insights'][:5]
-            data['market_signals'] = data['market_signals'][:5]
+            data['headlines'] = list(headlines)[:5]
+            data['key_insights'] = list(insights)[:5]
+            data['market_signals'] = list(signals)[:5]
             
-            logger.info(f"Successfully scraped Canary Media: {len(data['headlines'])} headlines, {len(data['key_insights'])} insights")
+            logger.info("Successfully scraped %s: %d headlines, %d insights",
+                        config['name'], len(data['headlines']), len(data['key_insights']))
             return data
             
         except Exception as e:
-            logger.error(f"Error scraping Canary Media: {e}")
-            return {'source': 'Canary Media', 'error': str(e), 'timestamp': datetime.now().isoformat()}
+            logger.error("Error scraping %s: %s", config['name'], e)
+            return {'source': config['name'], 'error': str(e), 'timestamp': datetime.now().isoformat()}
+    
+    def scrape_canary(self) -> Dict[str, Any]:
+        """Scrape Canary Media for clean energy news and analysis"""
+        return self._scrape_generic(SOURCE_CONFIGS['canary'])
     
     def scrape_industryweek(self) -> Dict[str, Any]:
         """Scrape Industry Week for manufacturing and industrial insights"""
-        logger.info("Scraping Industry Week for manufacturing insights...")
-        try:
-            # Try to find news/articles page
-            news_urls = [
-                'https://www.industryweek.com/',
-                'https://www.industryweek.com/news',
-                'https://www.industryweek.com/technology',
-                'https://www.industryweek.com/operations'
-            ]
-            
-            data = {
-                'source': 'Industry Week',
-                'timestamp': datetime.now().isoformat(),
-                'url': '',
-                'headlines': [],
-                'key_insights': [],
-                'market_signals': []
-            }
-            
-            for url in news_urls:
-                try:
-                    response = self.session.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    data['url'] = url
-                    
-                    # Look for news articles, stories, recent content
-                    news_selectors = [
-                        'article', '.article', '.story', '.post', '.entry',
-                        '.news-item', '.content-item', '.featured-article',
-                        '[class*="article"]', '[class*="story"]', '[class*="post"]',
-                        'h1', 'h2', 'h3'
-                    ]
-                    
-                    news_items = []
-                    for selector in news_selectors:
-                        items = soup.select(selector)
-                        if items:
-                            news_items.extend(items)
-                    
-                    # Extract headlines from news items
-                    for item in news_items[:10]:  # Limit to first 10 items
-                        # Look for headline text
-                        headline_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                        if headline_elem:
-                            text = headline_elem.text.strip()
-                            text = ' '.join(text.split())
-                            if text and len(text) > 10 and len(text) < 200:
-                                # Filter out navigation and common web elements
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
-                    
-                    # If no headlines found, try general content extraction
-                    if not data['headlines']:
-                        headlines = soup.find_all(['h1', 'h2', 'h3'], limit=10)
-                        for headline in headlines:
-                            text = headline.text.strip()
-                            text = ' '.join(text.split())
-                            if text and len(text) > 10 and len(text) < 200:
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
-                    
-                    # Extract key insights from news content
-                    content = soup.get_text()
-                    
-                    # Look for numbers and statistics in context
-                    sentences = content.split('.')
-                    for sentence in sentences:
-                        sentence = sentence.strip()
-                        if any(char.isdigit() for char in sentence) and 20 < len(sentence) < 300:
-                            # Look for manufacturing and industrial statistics
-                            industry_keywords = ['manufacturing', 'production', 'automation', 'technology', 'industry', 'supply chain', 'efficiency', 'productivity']
-                            if any(keyword in sentence.lower() for keyword in industry_keywords):
-                                clean_sentence = ' '.join(sentence.split())
-                                if len(clean_sentence) > 20:
-                                    data['key_insights'].append(clean_sentence)
-                    
-                    # Extract market signals from recent news
-                    industry_keywords = ['manufacturing', 'production', 'automation', 'technology', 'industry', 'supply chain', 'efficiency', 'productivity', 'semiconductor', 'automotive']
-                    for keyword in industry_keywords:
-                        if keyword.lower() in content.lower():
-                            sentences = content.split('.')
-                            for sentence in sentences:
-                                sentence = sentence.strip()
-                                if keyword.lower() in sentence.lower() and 20 < len(sentence) < 300:
-                                    clean_sentence = ' '.join(sentence.split())
-                                    if len(clean_sentence) > 20:
-                                        data['market_signals'].append(clean_sentence)
-                                        break
-                    
-                    if data['headlines'] or data['key_insights'] or data['market_signals']:
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
-                    continue
-            
-            # Limit results to avoid token limits
-            data['headlines'] = data['headlines'][:5]
-            data['key_insights'] = data['key_insights'][:5]
-            data['market_signals'] = data['market_signals'][:5]
-            
-            logger.info(f"Successfully scraped Industry Week: {len(data['headlines'])} headlines, {len(data['key_insights'])} insights")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Industry Week: {e}")
-            return {'source': 'Industry Week', 'error': str(e), 'timestamp': datetime.now().isoformat()}
+        return self._scrape_generic(SOURCE_CONFIGS['industryweek'])
     
     def scrape_eia(self) -> Dict[str, Any]:
         """Scrape EIA Today in Energy for daily energy insights"""
-        logger.info("Scraping EIA Today in Energy for energy market insights...")
-        try:
-            # Try to find news/articles page
-            news_urls = [
-                'https://www.eia.gov/todayinenergy/',
-                'https://www.eia.gov/todayinenergy/index.php',
-                'https://www.eia.gov/outlooks/steo/',
-                'https://www.eia.gov/'
-            ]
-            
-            data = {
-                'source': 'EIA Today in Energy',
-                'timestamp': datetime.now().isoformat(),
-                'url': '',
-                'headlines': [],
-                'key_insights': [],
-                'market_signals': []
-            }
-            
-            for url in news_urls:
-                try:
-                    response = self.session.get(url, timeout=10)
-                    response.raise_for_status()
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    data['url'] = url
-                    
-                    # Look for news articles, stories, recent content
-                    news_selectors = [
-                        'article', '.article', '.story', '.post', '.entry',
-                        '.news-item', '.content-item', '.featured-article',
-                        '[class*="article"]', '[class*="story"]', '[class*="post"]',
-                        'h1', 'h2', 'h3'
-                    ]
-                    
-                    news_items = []
-                    for selector in news_selectors:
-                        items = soup.select(selector)
-                        if items:
-                            news_items.extend(items)
-                    
-                    # Extract headlines from news items
-                    for item in news_items[:10]:  # Limit to first 10 items
-                        # Look for headline text
-                        headline_elem = item.find(['h1', 'h2', 'h3', 'h4', 'h5'])
-                        if headline_elem:
-                            text = headline_elem.text.strip()
-                            text = ' '.join(text.split())
-                            if text and len(text) > 10 and len(text) < 200:
-                                # Filter out navigation and common web elements
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
-                    
-                    # If no headlines found, try general content extraction
-                    if not data['headlines']:
-                        headlines = soup.find_all(['h1', 'h2', 'h3'], limit=10)
-                        for headline in headlines:
-                            text = headline.text.strip()
-                            text = ' '.join(text.split())
-                            if text and len(text) > 10 and len(text) < 200:
-                                if not any(skip in text.lower() for skip in ['menu', 'navigation', 'search', 'close', 'skip', 'subscribe', 'newsletter']):
-                                    data['headlines'].append(text)
-                    
-                    # Extract key insights from news content
-                    content = soup.get_text()
-                    
-                    # Look for numbers and statistics in context
-                    sentences = content.split('.')
-                    for sentence in sentences:
-                        sentence = sentence.strip()
-                        if any(char.isdigit() for char in sentence) and 20 < len(sentence) < 300:
-                            # Look for energy market statistics
-                            energy_keywords = ['energy', 'electricity', 'oil', 'gas', 'coal', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'consumption', 'production']
-                            if any(keyword in sentence.lower() for keyword in energy_keywords):
-                                clean_sentence = ' '.join(sentence.split())
-                                if len(clean_sentence) > 20:
-                                    data['key_insights'].append(clean_sentence)
-                    
-                    # Extract market signals from recent news
-                    energy_keywords = ['energy', 'electricity', 'oil', 'gas', 'coal', 'renewable', 'solar', 'wind', 'battery', 'emission', 'carbon', 'consumption', 'production', 'market', 'price']
-                    for keyword in energy_keywords:
-                        if keyword.lower() in content.lower():
-                            sentences = content.split('.')
-                            for sentence in sentences:
-                                sentence = sentence.strip()
-                                if keyword.lower() in sentence.lower() and 20 < len(sentence) < 300:
-                                    clean_sentence = ' '.join(sentence.split())
-                                    if len(clean_sentence) > 20:
-                                        data['market_signals'].append(clean_sentence)
-                                        break
-                    
-                    if data['headlines'] or data['key_insights'] or data['market_signals']:
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
-                    continue
-            
-            # Limit results to avoid token limits
-            data['headlines'] = data['headlines'][:5]
-            data['key_insights'] = data['key_insights'][:5]
-            data['market_signals'] = data['market_signals'][:5]
-            
-            logger.info(f"Successfully scraped EIA: {len(data['headlines'])} headlines, {len(data['key_insights'])} insights")
-            return data
-            
-        except Exception as e:
-            logger.error(f"Error scraping EIA: {e}")
-            return {'source': 'EIA Today in Energy', 'error': str(e), 'timestamp': datetime.now().isoformat()}
+        return self._scrape_generic(SOURCE_CONFIGS['eia'])
     
     def scrape_all_sources(self) -> Dict[str, Any]:
         """Scrape all configured sources"""
         logger.info("Starting comprehensive competitive intelligence scraping...")
         
-        self.data = {}
-        for key, source in self.sources.items():
-            if key == 'canary':
-                self.data[key] = self.scrape_canary()
-            elif key == 'industryweek':
-                self.data[key] = self.scrape_industryweek()
-            elif key == 'eia':
-                self.data[key] = self.scrape_eia()
-            # Add more source handlers here as needed
-            
-            time.sleep(2)  # Be respectful to servers
+        # Each source lives on its own host and tries its candidate URLs one after
+        # another, so scraping sources concurrently keeps one in-flight request per
+        # server while overlapping network waits.
+        # Add more sources by extending SOURCE_CONFIGS.
+        results = {}
+        active = [key for key in self.sources if key in SOURCE_CONFIGS]
+        if active:
+            with ThreadPoolExecutor(max_workers=len(active)) as executor:
+                futures = {executor.submit(self._scrape_generic, SOURCE_CONFIGS[key]): key for key in active}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
         
+        # Keep the configured source order in the output
+        self.data = {key: results[key] for key in active}
         self.data['scraping_timestamp'] = datetime.now().isoformat()
         logger.info("Completed scraping all sources")
         return self.data
 
+# Section headers in the AI response, e.g. "Signal: Positive - ..."
+SECTION_HEADER_RE = re.compile(r'^(date|key insights|signal|risk)\s*:\s*(.*)$', re.IGNORECASE)
+SECTION_NAMES = {'date': 'Date', 'key insights': 'Key insights', 'signal': 'Signal', 'risk': 'Risk'}
+
+# (pattern, label) pairs checked in order; the first pattern found in the text wins.
+# The marked forms come first so they beat a stray keyword elsewhere in the text.
+SIGNAL_PATTERNS = (
+    ('🟢 positive', 'Positive'),
+    ('🔴 negative', 'Negative'),
+    ('positive', 'Positive'),
+    ('negative', 'Negative')
+)
+RISK_PATTERNS = (
+    ('risk: high', 'High'),
+    ('risk: medium', 'Medium'),
+    ('risk: low', 'Low'),
+    ('high', 'High'),
+    ('medium', 'Medium')
+)
+# One lookahead alternation per table, so a single find_keywords scan reports every pattern present
+SIGNAL_PATTERNS_RE = compile_keyword_pattern([pattern for pattern, _ in SIGNAL_PATTERNS])
+RISK_PATTERNS_RE = compile_keyword_pattern([pattern for pattern, _ in RISK_PATTERNS])
+
+# When a section is missing the whole response is scanned instead, so a bare keyword
+# only counts next to its label ("Risk: High", "signal ... positive"); otherwise words
+# like "highlights" or "positive" in the insights would decide the label
+SIGNAL_FALLBACK_PATTERNS = tuple((re.compile(pattern), label) for pattern, label in (
+    (r'🟢 positive', 'Positive'),
+    (r'🔴 negative', 'Negative'),
+    (r'\bsignal\b[^\n]*\bpositive\b', 'Positive'),
+    (r'\bsignal\b[^\n]*\bnegative\b', 'Negative')
+))
+RISK_FALLBACK_PATTERNS = tuple((re.compile(pattern), label) for pattern, label in (
+    (r'\brisk\b[^\n]*\bhigh\b', 'High'),
+    (r'\brisk\b[^\n]*\bmedium\b', 'Medium')
+))
+
+def _first_match(text_lower: str, patterns: Tuple[Tuple[str, str], ...],
+                 patterns_re: 're.Pattern', default: str) -> str:
+    """Return the label of the first pattern found in already-lowercased text, or default"""
+    found = find_keywords(text_lower, [pattern for pattern, _ in patterns], patterns_re)
+    return next((label for pattern, label in patterns if pattern in found), default)
+
+def _first_fallback_match(text_lower: str, patterns: Tuple[Tuple['re.Pattern', str], ...],
+                          default: str) -> str:
+    """Return the label of the first fallback regex that matches the lowercased response, or default"""
+    return next((label for regex, label in patterns if regex.search(text_lower)), default)
+
+def _truncate_words(text: str, max_words: int) -> str:
+    """Collapse whitespace and cut text to max_words, ending on the last full sentence if any"""
+    # maxsplit stops tokenizing once the limit is passed; the remainder stays one piece
+    words = text.split(None, max_words)
+    if len(words) <= max_words:
+        return ' '.join(words)
+    truncated = ' '.join(words[:max_words])
+    last_period = truncated.rfind('.')
+    if last_period != -1:
+        return truncated[:last_period + 1]
+    return truncated + '...'
+
+# Header labels the model sometimes repeats inside the insights text
+INSIGHT_LABEL_RE = re.compile(r'[Dd]ate:|[Kk]ey insights:')
+
+def _clean_insights(lines: List[str]) -> str:
+    """Join the Key insights lines, drop stray header text and apply the 200-word limit"""
+    text = ' '.join(line for line in lines if not line.lower().startswith(('date:', 'key insights:')))
+    return _truncate_words(INSIGHT_LABEL_RE.sub('', text), 200)
+
+@lru_cache(maxsize=512)
+def _parse_analysis_cached(analysis_text: str, source: str, today: str) -> Dict[str, Any]:
+    """Parse AI analysis into structured format; callers must copy the shared result"""
+    try:
+        result = {
+            'Date': today,
+            'Source': source,
+            'Key insights': '',
+            'Signal': '',
+            'Risk': ''
+        }
+        
+        # Single pass over the response: a header line opens its section, seeded
+        # with any text after the colon, and following lines are added to it
+        sections = {}
+        current_section = None
+        for line in analysis_text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            
+            header = SECTION_HEADER_RE.match(line)
+            if header:
+                name = SECTION_NAMES[header.group(1).lower()]
+                if name == 'Date':
+                    result['Date'] = header.group(2)
+                else:
+                    current_section = name
+                    sections[name] = [header.group(2)] if header.group(2) else []
+            elif current_section:
+                sections[current_section].append(line)
+        
+        insights_lines = sections.pop('Key insights', [])
+        for name, content in sections.items():
+            result[name] = ' '.join(content)
+        result['Key insights'] = _clean_insights(insights_lines)
+        
+        # Reduce Signal and Risk to their labels; when a section is missing,
+        # classify from labelled mentions in the whole response, lowercased at most once
+        text_lower = '' if result['Signal'] and result['Risk'] else analysis_text.lower()
+        if result['Signal']:
+            result['Signal'] = _first_match(result['Signal'].lower(), SIGNAL_PATTERNS,
+                                            SIGNAL_PATTERNS_RE, 'Neutral')
+        else:
+            result['Signal'] = _first_fallback_match(text_lower, SIGNAL_FALLBACK_PATTERNS, 'Neutral')
+        if result['Risk']:
+            result['Risk'] = _first_match(result['Risk'].lower(), RISK_PATTERNS,
+                                          RISK_PATTERNS_RE, 'Low')
+        else:
+            result['Risk'] = _first_fallback_match(text_lower, RISK_FALLBACK_PATTERNS, 'Low')
+        
+        logger.debug("Parsed result for %s: %s", source, result)
+        return result
+        
+    except Exception as e:
+        logger.error("Error parsing analysis: %s", e)
+        return {
+            'Date': today,
+            'Source': source,
+            'Key insights': 'Analysis parsing error',
+            'Signal': 'Neutral',
+            'Risk': 'Low'
+        }
+
+# Only the first few items of each kind per day are sent to the AI
+MAX_DAILY_ITEMS = 5
+
+class DailyBucket:
+    """Scraped content aggregated for one analysis day"""
+    __slots__ = ('sources', 'headlines', 'insights', 'signals', 'seen')
+    
+    def __init__(self):
+        self.sources: List[str] = []
+        self.headlines: List[str] = []
+        self.insights: List[str] = []
+        self.signals: List[str] = []
+        # Case-folded texts already taken into each list, so wire copy republished
+        # by several sites is only sent to the model once
+        self.seen: Dict[str, set] = {'headlines': set(), 'insights': set(), 'signals': set()}
+    
+    def _extend_unseen(self, name: str, items: List[str]):
+        """Append items no earlier source contributed to list name, up to MAX_DAILY_ITEMS"""
+        target = getattr(self, name)
+        seen = self.seen[name]
+        for item in items:
+            if len(target) >= MAX_DAILY_ITEMS:
+                break
+            key = item.casefold()
+            if key not in seen:
+                seen.add(key)
+                target.append(item)
+    
+    def add(self, source: str, headlines: List[str], insights: List[str], signals: List[str]):
+        """Record a source, keeping at most MAX_DAILY_ITEMS of each item list"""
+        self.sources.append(source)
+        self._extend_unseen('headlines', headlines)
+        self._extend_unseen('insights', insights)
+        self._extend_unseen('signals', signals)
+
+# Analyst persona and Signal/Risk rubric, sent as the system message. It is identical
+# for every request so OpenAI's prompt caching can reuse it as a cached prefix
+ANALYSIS_SYSTEM_MESSAGE = """You are a competitive intelligence analyst specializing in industrial AI, semiconductor markets, and smart manufacturing. Focus on Infineon's ambition to maximize efficiency, reliability, and sustainability in industrial operations through hybrid AI models applied to industrial equipment at scale. Provide comprehensive daily analysis based on multiple sources.
+
+Using Infineon's Signal/Risk framework for Competitive and Market Intelligence Analysis:
+
+INFINEON'S STRATEGIC AMBITION: Maximize efficiency, reliability, and sustainability in industrial operations by applying hybrid AI models to industrial equipment at scale.
+
+SIGNAL ANALYSIS (Positive/Neutral/Negative):
+- 🟢 Positive: The event represents an opportunity for Infineon's hybrid AI industrial strategy. Examples: new AI regulations favoring edge computing, competitor delays in AI chip production, government funding for industrial AI, market growth in industrial IoT, increased demand for energy-efficient AI processing, breakthroughs in AI-powered predictive maintenance.
+- ⚪ Neutral: The event is noted for awareness but has no immediate impact on Infineon's hybrid AI industrial ambitions. Examples: general market news without AI/industrial implications, competitor changes in unrelated sectors.
+- 🔴 Negative: The event represents a threat to Infineon's hybrid AI industrial strategy. Examples: rival launching superior AI chips for industrial applications, competitor gaining major industrial AI design wins, regulatory changes that disadvantage Infineon's AI approach, breakthrough competitive AI technologies for industrial equipment.
+
+RISK ANALYSIS (Low/Medium/High):
+- Low: The potential impact is minor, easily manageable, or very unlikely to materialize. Examples: small competitor announcements, general market commentary, minor regulatory updates.
+- Medium: The event could have a significant impact, but it may not be immediate, or there may be time to formulate a response. Examples: competitor AI product announcements with future timelines, market trends affecting industrial AI demand in 6-12 months.
+- High: The event poses a direct, severe, and immediate threat (or opportunity) to Infineon's hybrid AI industrial objectives. Examples: major competitor design wins in industrial AI, immediate regulatory changes affecting AI deployment, supply chain disruptions for AI chips, breakthrough competitive AI technologies.
+
+Focus specifically on implications for Infineon's hybrid AI industrial strategy including:
+- AI-powered industrial equipment and automation
+- Edge computing and AI processing at scale
+- Predictive maintenance and reliability systems
+- Energy efficiency in industrial AI applications
+- Industrial IoT and smart manufacturing
+- Power semiconductors for AI processing (SiC, GaN, IGBT)
+- Industrial motor drives and power supplies with AI integration
+- Renewable energy systems with AI optimization"""
+
+# Per-day user message; only the $-fields change from one day to the next
+ANALYSIS_PROMPT = Template("""Analyze competitive intelligence for Infineon Technologies AG for $date.
+
+Sources analyzed: $sources
+Headlines: $headlines
+Key Insights: $insights
+Market Signals: $signals
+
+Provide analysis in this exact format (do not include the field names in the content):
+Date: $date
+Key insights: [Comprehensive analysis focusing on implications for Infineon's hybrid AI industrial strategy, competitive landscape, and strategic considerations for maximizing efficiency, reliability, and sustainability in industrial operations. Be thorough and detailed.]
+Signal: [Positive/Neutral/Negative with brief reasoning]
+Risk: [Low/Medium/High with brief reasoning]
+""")
+
+# Fingerprint of the prompt wording, part of every LLM cache key so that editing the
+# prompt invalidates responses produced by the old wording
+PROMPT_VERSION = hashlib.sha256(
+    (ANALYSIS_SYSTEM_MESSAGE + ANALYSIS_PROMPT.template).encode('utf-8')
+).hexdigest()[:12]
+
+# Direct (non-batch) analysis calls run concurrently up to this limit, and calls
+# rejected with HTTP 429 are retried with exponential backoff
+OPENAI_MAX_CONCURRENCY = 8
+OPENAI_RATE_LIMIT_RETRIES = 4
+
+class LLMCache:
+    """Exact-match cache of AI analysis responses, kept in memory and as JSON files on disk"""
+    
+    # Shared by every instance so repeated runs in one process (e.g. the scheduler)
+    # skip the disk as well
+    _memory: Dict[str, str] = {}
+    
+    def __init__(self, cache_dir: str = None, max_age: timedelta = timedelta(days=7)):
+        self.cache_dir = Path(cache_dir or os.getenv('LLM_CACHE_DIR', 'data/llm_cache'))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+    
+    @staticmethod
+    def make_key(model: str, date: str, sources: List[str], headlines: List[str],
+                 insights: List[str], signals: List[str]) -> str:
+        """Hash the analysis inputs; list order does not affect the key"""
+        payload = dump_json_bytes({
+            'prompt': PROMPT_VERSION,
+            'model': model,
+            'date': date,
+            'sources': sorted(sources),
+            'headlines': sorted(headlines),
+            'insights': sorted(insights),
+            'signals': sorted(signals)
+        }, sort_keys=True)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, key: str):
+        """Return the cached analysis text for key, or None on a miss or expired entry"""
+        if key in self._memory:
+            return self._memory[key]
+        path = self.cache_dir / f'{key}.json'
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            expired = datetime.now() - datetime.fromisoformat(entry['created']) > self.max_age
+            analysis_text = entry['analysis_text']
+            if not isinstance(analysis_text, str):
+                raise TypeError("analysis_text is not a string")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Unreadable or malformed entries are treated as misses and overwritten later
+            if not isinstance(e, FileNotFoundError):
+                logger.warning("Ignoring unusable LLM cache entry %s: %s", key, e)
+            return None
+        if expired:
+            return None
+        self._memory[key] = analysis_text
+        return analysis_text
+    
+    def set(self, key: str, analysis_text: str):
+        """Store analysis text under key"""
+        self._memory[key] = analysis_text
+        entry = {'created': datetime.now().isoformat(), 'analysis_text': analysis_text}
+        try:
+            write_atomic(self.cache_dir / f'{key}.json', dump_json_bytes(entry))
+        except OSError as e:
+            logger.warning("Could not write LLM cache entry %s: %s", key, e)
+
+# Embedding model used to compare daily inputs in the semantic cache
+SEMANTIC_CACHE_MODEL = 'text-embedding-3-small'
+# An analysis "Date:" line, rewritten when a response is reused for another day
+ANALYSIS_DATE_LINE_RE = re.compile(r'^(\s*date\s*:).*$', re.IGNORECASE | re.MULTILINE)
+
+class SemanticCache:
+    """Near-match cache: reuse an analysis when a day's inputs embed close to earlier ones"""
+    
+    def __init__(self, client: OpenAI, threshold: float, cache_dir: str = None):
+        self.client = client
+        self.threshold = threshold
+        self.path = Path(cache_dir or os.getenv('LLM_CACHE_DIR', 'data/llm_cache')) / 'semantic' / 'cache.npz'
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Rows are unit-length embeddings, so a matrix-vector product gives cosine similarity
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.tags = np.array([], dtype=str)
+        self.texts = np.array([], dtype=str)
+        try:
+            with np.load(self.path, allow_pickle=False) as stored:
+                self.vectors, self.tags, self.texts = stored['vectors'], stored['tags'], stored['texts']
+        except (OSError, KeyError, ValueError):
+            pass
+    
+    def embed(self, text: str) -> 'np.ndarray':
+        """Embed text as a unit-length float32 vector"""
+        response = self.client.embeddings.create(model=SEMANTIC_CACHE_MODEL, input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+    
+    def lookup(self, vector: 'np.ndarray', tag: str):
+        """Return the stored analysis most similar to vector under tag, if above the threshold"""
+        if not len(self.texts) or self.vectors.shape[1] != vector.shape[0]:
+            return None
+        similarities = self.vectors @ vector
+        similarities[self.tags != tag] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        logger.info("Semantic cache hit (similarity %.3f)", similarities[best])
+        return str(self.texts[best])
+    
+    def add(self, vector: 'np.ndarray', tag: str, analysis_text: str):
+        """Store an analysis under its input embedding and write the cache file"""
+        if len(self.texts) and self.vectors.shape[1] != vector.shape[0]:
+            return
+        self.vectors = np.vstack([self.vectors.reshape(-1, vector.shape[0]), vector[np.newaxis, :]])
+        self.tags = np.append(self.tags, tag)
+        self.texts = np.append(self.texts, analysis_text)
+        tmp_path = self.path.with_name(f'cache.{os.getpid()}.tmp')
+        try:
+            # Write beside the target and rename, so readers never see a partial file
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, vectors=self.vectors, tags=self.tags, texts=self.texts)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write semantic cache: %s", e)
+
 class InfineonIntelligenceAnalyzer:
     """AI-powered analysis for Infineon's competitive intelligence"""
     
@@ -479,7 +826,23 @@ class InfineonIntelligenceAnalyzer:
         if not self.api_key:
             raise ValueError("OpenAI API key not found")
         
-        openai.api_key = self.api_key
+        # One client per analyzer so its HTTP connection pool is reused across calls
+        self.client = OpenAI(api_key=self.api_key)
+        
+        # Identical daily inputs (e.g. re-runs on the same day) reuse the earlier response
+        self.cache = LLMCache()
+        
+        # Near-identical inputs can reuse a response too, when a similarity threshold is
+        # configured; this costs one embedding call per day on exact-cache misses
+        threshold = os.getenv('SEMANTIC_CACHE_THRESHOLD')
+        self.semantic_cache = None
+        if threshold and NUMPY_AVAILABLE:
+            self.semantic_cache = SemanticCache(self.client, float(threshold))
+        elif threshold:
+            logger.warning("SEMANTIC_CACHE_THRESHOLD is set but numpy is not installed; semantic cache disabled")
+        
+        # Batch API jobs cost half as much but can take up to 24h; opt in via .env
+        self.use_batch = os.getenv('OPENAI_BATCH', 'false').lower() in ('1', 'true', 'yes')
     
     def analyze_for_infineon(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze scraped data using Infineon's Signal/Risk framework - one row per day"""
@@ -487,7 +850,7 @@ class InfineonIntelligenceAnalyzer:
             logger.info("Starting Infineon-specific competitive intelligence analysis...")
             
             # Collect all data for daily aggregation
-            daily_data = {}
+            daily_data: Dict[str, DailyBucket] = {}
             current_date = datetime.now().strftime('%Y-%m-%d')
             
             for source_key, source_data in data.items():
@@ -503,48 +866,19 @@ class InfineonIntelligenceAnalyzer:
                 def clean_and_truncate_text(text_list, max_chars=150):
                     cleaned = []
                     for text in text_list:
-                        # Remove excessive whitespace and newlines
-                        cleaned_text = ' '.join(text.split())
-                        
-                        # Remove common web artifacts and navigation
-                        artifacts = [
-                            'Toggle filter', 'Chevron down', 'Read documentation', 'cross',
-                            'Back to homepage', 'Contact Us', 'Useful links', 'Latest insights',
-                            'Latest updates', 'Open data', 'About us', 'Careers',
-                            'Toggle navigation', 'My User', 'Create account', 'Log in',
-                            'View form', 'View source', 'History', 'Refresh', 'What links here',
-                            'Browse Properties', 'From Open Energy Information'
-                        ]
-                        
-                        for artifact in artifacts:
-                            cleaned_text = cleaned_text.replace(artifact, '')
-                        
-                        # Remove excessive whitespace again
-                        cleaned_text = ' '.join(cleaned_text.split())
+                        # Remove common web artifacts and navigation, then collapse
+                        # excessive whitespace and newlines in a single pass
+                        cleaned_text = normalize_whitespace(ARTIFACTS_RE.sub('', text))
                         
                         # Only add if meaningful and contains relevant keywords
                         if len(cleaned_text) > 30 and len(cleaned_text) < max_chars:
                             # Check if it contains relevant keywords for Infineon's hybrid AI industrial strategy
-                            relevant_keywords = [
-                                'ai', 'artificial intelligence', 'industrial', 'manufacturing', 'automation',
-                                'predictive maintenance', 'edge computing', 'iot', 'smart', 'efficiency',
-                                'reliability', 'sustainability', 'semiconductor', 'chip', 'power',
-                                'motor', 'drive', 'equipment', 'optimization', 'machine learning',
-                                'energy', 'electricity', 'renewable', 'solar', 'wind', 'battery',
-                                'emission', 'carbon', 'clean', 'transition', 'investment', 'market',
-                                'technology', 'research', 'production', 'factory', 'industry'
-                            ]
-                            if any(keyword in cleaned_text.lower() for keyword in relevant_keywords):
+                            if RELEVANT_KEYWORDS_RE.search(cleaned_text):
                                 cleaned.append(cleaned_text)
                         elif len(cleaned_text) >= max_chars:
                             # Truncate and check if meaningful
                             truncated = cleaned_text[:max_chars] + "..."
-                            relevant_keywords = [
-                                'ai', 'artificial intelligence', 'industrial', 'manufacturing', 'automation',
-                                'predictive maintenance', 'edge computing', 'iot', 'smart', 'efficiency',
-                                'reliability', 'sustainability', 'semiconductor', 'chip', 'power'
-                            ]
-                            if any(keyword in truncated.lower() for keyword in relevant_keywords):
+                            if CORE_KEYWORDS_RE.search(truncated):
                                 cleaned.append(truncated)
                     
                     return cleaned
@@ -554,379 +888,250 @@ class InfineonIntelligenceAnalyzer:
                 signals = clean_and_truncate_text(signals)
                 
                 # Aggregate data by day
-                if current_date not in daily_data:
-                    daily_data[current_date] = {
-                        'sources': [],
-                        'headlines': [],
-                        'insights': [],
-                        'signals': []
-                    }
+                bucket = daily_data.get(current_date)
+                if bucket is None:
+                    bucket = daily_data[current_date] = DailyBucket()
                 
-                daily_data[current_date]['sources'].append(source_data.get('source', 'Unknown'))
-                daily_data[current_date]['headlines'].extend(headlines)
-                daily_data[current_date]['insights'].extend(insights)
-                daily_data[current_date]['signals'].extend(signals)
+                bucket.add(source_data.get('source', 'Unknown'), headlines, insights, signals)
                 
-                logger.info(f"Added data from {source_data.get('source', 'Unknown')} to daily aggregation")
+                logger.info("Added data from %s to daily aggregation", source_data.get('source', 'Unknown'))
             
-            # Now analyze aggregated daily data
-            analysis_results = []
+            # Pass 1: build one request per day. Days without enough data or with a
+            # cached response are resolved here, so only real API work is left
+            analysis_texts = {}
+            pending_requests = {}
+            sources_by_date = {}
+            semantic_vectors = {}
+            semantic_tag = f"{self.model}:{PROMPT_VERSION}"
             
             for date, aggregated_data in daily_data.items():
                 # Combine all data for the day
-                all_headlines = aggregated_data['headlines'][:5]  # Limit to 5 headlines
-                all_insights = aggregated_data['insights'][:5]  # Limit to 5 insights
-                all_signals = aggregated_data['signals'][:5]  # Limit to 5 signals
-                all_sources = aggregated_data['sources']
+                # Buckets are already capped at MAX_DAILY_ITEMS per list
+                all_headlines = aggregated_data.headlines
+                all_insights = aggregated_data.insights
+                all_signals = aggregated_data.signals
+                all_sources = aggregated_data.sources
+                sources_str = ', '.join(all_sources)
+                sources_by_date[date] = sources_str
                 
-                # Log what's being sent to AI
-                logger.info(f"Analyzing aggregated data for {date}:")
-                logger.info(f"  Sources: {all_sources}")
-                logger.info(f"  Headlines: {all_headlines}")
-                logger.info(f"  Insights: {all_insights}")
-                logger.info(f"  Signals: {all_signals}")
+                # Log what's being sent to AI; the item text itself only at DEBUG, cut to
+                # 200 characters, so normal runs skip building it
+                logger.info("Analyzing aggregated data for %s: %d headlines, %d insights, %d signals from %s",
+                            date, len(all_headlines), len(all_insights), len(all_signals), sources_str)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  Headlines: %.200s", ' | '.join(all_headlines))
+                    logger.debug("  Insights: %.200s", ' | '.join(all_insights))
+                    logger.debug("  Signals: %.200s", ' | '.join(all_signals))
                 
-                # Create analysis prompt for daily aggregation
-                prompt = f"""
-                Analyze competitive intelligence for Infineon Technologies AG for {date}, focusing on their ambition to maximize efficiency, reliability, and sustainability in industrial operations by applying hybrid AI models to industrial equipment at scale.
-
-                Sources analyzed: {', '.join(all_sources)}
-                Headlines: {all_headlines}
-                Key Insights: {all_insights}
-                Market Signals: {all_signals}
-
-                Using Infineon's Signal/Risk framework for Competitive and Market Intelligence Analysis:
-
-                INFINEON'S STRATEGIC AMBITION: Maximize efficiency, reliability, and sustainability in industrial operations by applying hybrid AI models to industrial equipment at scale.
-
-                SIGNAL ANALYSIS (Positive/Neutral/Negative):
-                - 🟢 Positive: The event represents an opportunity for Infineon's hybrid AI industrial strategy. Examples: new AI regulations favoring edge computing, competitor delays in AI chip production, government funding for industrial AI, market growth in industrial IoT, increased demand for energy-efficient AI processing, breakthroughs in AI-powered predictive maintenance.
-                - ⚪ Neutral: The event is noted for awareness but has no immediate impact on Infineon's hybrid AI industrial ambitions. Examples: general market news without AI/industrial implications, competitor changes in unrelated sectors.
-                - 🔴 Negative: The event represents a threat to Infineon's hybrid AI industrial strategy. Examples: rival launching superior AI chips for industrial applications, competitor gaining major industrial AI design wins, regulatory changes that disadvantage Infineon's AI approach, breakthrough competitive AI technologies for industrial equipment.
-
-                RISK ANALYSIS (Low/Medium/High):
-                - Low: The potential impact is minor, easily manageable, or very unlikely to materialize. Examples: small competitor announcements, general market commentary, minor regulatory updates.
-                - Medium: The event could have a significant impact, but it may not be immediate, or there may be time to formulate a response. Examples: competitor AI product announcements with future timelines, market trends affecting industrial AI demand in 6-12 months.
-                - High: The event poses a direct, severe, and immediate threat (or opportunity) to Infineon's hybrid AI industrial objectives. Examples: major competitor design wins in industrial AI, immediate regulatory changes affecting AI deployment, supply chain disruptions for AI chips, breakthrough competitive AI technologies.
-
-                Focus specifically on implications for Infineon's hybrid AI industrial strategy including:
-                - AI-powered industrial equipment and automation
-                - Edge computing and AI processing at scale
-                - Predictive maintenance and reliability systems
-                - Energy efficiency in industrial AI applications
-                - Industrial IoT and smart manufacturing
-                - Power semiconductors for AI processing (SiC, GaN, IGBT)
-                - Industrial motor drives and power supplies with AI integration
-                - Renewable energy systems with AI optimization
-
-                Provide analysis in this exact format (do not include the field names in the content):
-                Date: {date}
-                Key insights: [Comprehensive analysis focusing on implications for Infineon's hybrid AI industrial strategy, competitive landscape, and strategic considerations for maximizing efficiency, reliability, and sustainability in industrial operations. Be thorough and detailed.]
-                Signal: [Positive/Neutral/Negative with brief reasoning]
-                Risk: [Low/Medium/High with brief reasoning]
-                """
+                # Check if we have sufficient data for analysis
+                total_data_points = len(all_headlines) + len(all_insights) + len(all_signals)
+                if total_data_points < 2:
+                    logger.warning("Insufficient data for analysis on %s: only %d data points", date, total_data_points)
+                    analysis_texts[date] = "Unable to generate analysis due to insufficient data. Need at least 2 data points from sources."
+                    continue
                 
-                # Call OpenAI API
-                try:
-                    logger.info(f"Calling OpenAI API with model: {self.model} for daily analysis")
-                    
-                    # Check if we have sufficient data for analysis
-                    total_data_points = len(all_headlines) + len(all_insights) + len(all_signals)
-                    if total_data_points < 2:
-                        logger.warning(f"Insufficient data for analysis on {date}: only {total_data_points} data points")
-                        analysis_text = "Unable to generate analysis due to insufficient data. Need at least 2 data points from sources."
+                cache_key = self.cache.make_key(self.model, date, all_sources,
+                                                all_headlines, all_insights, all_signals)
+                cached_text = self.cache.get(cache_key)
+                if cached_text:
+                    logger.info("Using cached AI response for daily analysis %s", date)
+                    analysis_texts[date] = cached_text
+                    continue
+                
+                if self.semantic_cache:
+                    try:
+                        vector = self.semantic_cache.embed('\n'.join([sources_str] + all_headlines + all_insights + all_signals))
+                    except openai.OpenAIError as e:
+                        logger.warning("Semantic cache lookup failed for %s: %s", date, e)
                     else:
-                        response = openai.ChatCompletion.create(
-                            model=self.model,
-                            messages=[
-                                {"role": "system", "content": "You are a competitive intelligence analyst specializing in industrial AI, semiconductor markets, and smart manufacturing. Focus on Infineon's ambition to maximize efficiency, reliability, and sustainability in industrial operations through hybrid AI models applied to industrial equipment at scale. Provide comprehensive daily analysis based on multiple sources."},
-                                {"role": "user", "content": prompt}
-                            ],
-                            max_completion_tokens=1000
-                        )
-                        
-                        analysis_text = response.choices[0].message.content
-                        logger.info(f"Raw AI response for daily analysis {date}: {analysis_text}")
-                        logger.info(f"Response length: {len(analysis_text)} characters")
-                        
-                        if not analysis_text:
-                            logger.warning(f"Empty response from OpenAI API for daily analysis {date}")
-                            analysis_text = "Unable to generate analysis due to insufficient data."
-                        
-                except openai.error.InvalidRequestError as e:
-                    logger.error(f"Invalid model request for daily analysis {date}: {e}")
-                    analysis_text = f"Model configuration error: {str(e)}. Please check OPENAI_MODEL setting."
-                except openai.error.AuthenticationError as e:
-                    logger.error(f"Authentication error for daily analysis {date}: {e}")
-                    analysis_text = f"Authentication error: {str(e)}. Please check OPENAI_API_KEY."
-                except Exception as e:
-                    logger.error(f"Error calling OpenAI API for daily analysis {date}: {e}")
-                    analysis_text = f"Error in AI analysis: {str(e)}"
+                        similar_text = self.semantic_cache.lookup(vector, semantic_tag)
+                        if similar_text:
+                            # The reused analysis was written for another day
+                            analysis_texts[date] = ANALYSIS_DATE_LINE_RE.sub(
+                                lambda match: f"{match.group(1)} {date}", similar_text)
+                            continue
+                        semantic_vectors[date] = vector
                 
+                # Only days that still need the API get a prompt built
+                prompt = ANALYSIS_PROMPT.substitute(
+                    date=date,
+                    sources=sources_str,
+                    headlines=all_headlines,
+                    insights=all_insights,
+                    signals=all_signals
+                )
+                messages = [
+                    {"role": "system", "content": ANALYSIS_SYSTEM_MESSAGE},
+                    {"role": "user", "content": prompt}
+                ]
+                pending_requests[date] = (messages, cache_key)
+            
+            # Pass 2: dispatch the remaining requests, as one Batch API job when enabled;
+            # anything the batch did not return goes out as concurrent direct calls
+            if pending_requests and self.use_batch:
+                analysis_texts.update(self._run_batch(pending_requests))
+            direct_requests = {date: request for date, request in pending_requests.items()
+                               if date not in analysis_texts}
+            if direct_requests:
+                analysis_texts.update(asyncio.run(self._request_analyses(direct_requests)))
+            
+            # Remember the new responses for near-matching inputs on later runs; only
+            # successful ones were stored in the exact cache
+            for date, vector in semantic_vectors.items():
+                if self.cache.get(pending_requests[date][1]):
+                    self.semantic_cache.add(vector, semantic_tag, analysis_texts[date])
+            
+            analysis_results = []
+            for date in daily_data:
                 # Parse the analysis
-                result = self._parse_analysis(analysis_text, f"Daily Analysis - {', '.join(all_sources)}")
+                result = self._parse_analysis(analysis_texts[date], f"Daily Analysis - {sources_by_date[date]}")
                 analysis_results.append(result)
                 
-                logger.info(f"Completed daily analysis for {date}")
+                logger.info("Completed daily analysis for %s", date)
             
             logger.info("Completed all competitive intelligence analysis")
             return analysis_results
             
         except Exception as e:
-            logger.error(f"Error in competitive intelligence analysis: {e}")
+            logger.error("Error in competitive intelligence analysis: %s", e)
             return []
     
-    def _parse_analysis(self, analysis_text: str, source: str) -> Dict[str, Any]:
-        """Parse AI analysis into structured format"""
+    async def _request_analyses(self, direct_requests: Dict[str, Tuple[List[Dict[str, str]], str]]) -> Dict[str, str]:
+        """Run the daily requests concurrently, at most OPENAI_MAX_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+        async with AsyncOpenAI(api_key=self.api_key) as client:
+            analysis_texts = await asyncio.gather(*(
+                self._request_analysis(client, semaphore, date, messages, cache_key)
+                for date, (messages, cache_key) in direct_requests.items()
+            ))
+        return dict(zip(direct_requests, analysis_texts))
+    
+    async def _request_analysis(self, client: AsyncOpenAI, semaphore: asyncio.Semaphore,
+                                date: str, messages: List[Dict[str, str]], cache_key: str) -> str:
+        """Run one daily analysis request against the chat completions API"""
         try:
-            lines = analysis_text.split('\n')
-            result = {
-                'Date': datetime.now().strftime('%Y-%m-%d'),
-                'Source': source,
-                'Key insights': '',
-                'Signal': '',
-                'Risk': ''
-            }
-            
-            current_section = None
-            section_content = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                # Check for section headers
-                if line.lower().startswith('date:'):
-                    result['Date'] = line.replace('Date:', '').replace('date:', '').strip()
-                elif line.lower().startswith('key insights:'):
-                    current_section = 'Key insights'
-                    section_content = []
-                elif line.lower().startswith('signal:'):
-                    current_section = 'Signal'
-                    section_content = []
-                elif line.lower().startswith('risk:'):
-                    current_section = 'Risk'
-                    section_content = []
-                else:
-                    # Add content to current section
-                    if current_section:
-                        section_content.append(line)
-                        if current_section == 'Key insights':
-                            # Clean the key insights content immediately
-                            insights_text = ' '.join(section_content)
-                            # Remove any date or header lines
-                            lines = insights_text.split('\n')
-                            filtered_lines = []
-                            for line in lines:
-                                line = line.strip()
-                                if line and not line.lower().startswith('date:') and not line.lower().startswith('key insights:'):
-                                    filtered_lines.append(line)
-                            result['Key insights'] = ' '.join(filtered_lines).strip()
-                            # Store the full content for later processing
-                            result['_full_insights'] = result['Key insights']
-                        elif current_section == 'Signal':
-                            result['Signal'] = ' '.join(section_content)
-                        elif current_section == 'Risk':
-                            result['Risk'] = ' '.join(section_content)
-            
-            # Clean up the parsed content
-            if result['Key insights']:
-                # Remove any remaining "Key insights:" prefix and date lines
-                cleaned_insights = result['Key insights']
-                # Remove date and header lines that might be included
-                lines = cleaned_insights.split('\n')
-                filtered_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.lower().startswith('date:') and not line.lower().startswith('key insights:'):
-                        filtered_lines.append(line)
-                cleaned_insights = ' '.join(filtered_lines)
-                # Additional cleanup to remove any remaining artifacts
-                cleaned_insights = cleaned_insights.replace('Date:', '').replace('date:', '').replace('Key insights:', '').replace('key insights:', '').strip()
-                result['Key insights'] = cleaned_insights.strip()
-                
-                # Limit to 200 words but preserve more meaningful content
-                words = result['Key insights'].split()
-                if len(words) > 200:
-                    # Try to find a good breaking point (end of sentence)
-                    truncated = ' '.join(words[:200])
-                    # Look for the last complete sentence
-                    sentences = truncated.split('.')
-                    if len(sentences) > 1:
-                        # Remove the last incomplete sentence
-                        complete_sentences = sentences[:-1]
-                        result['Key insights'] = '. '.join(complete_sentences) + '.'
-                    else:
-                        result['Key insights'] = truncated + '...'
-                else:
-                    result['Key insights'] = ' '.join(words)
-            
-            if result['Signal']:
-                # Extract just the signal type (Positive/Neutral/Negative)
-                signal_lower = result['Signal'].lower()
-                if 'positive' in signal_lower:
-                    result['Signal'] = 'Positive'
-                elif 'negative' in signal_lower:
-                    result['Signal'] = 'Negative'
-                else:
-                    result['Signal'] = 'Neutral'
-            
-            if result['Risk']:
-                # Extract just the risk level (Low/Medium/High)
-                risk_lower = result['Risk'].lower()
-                if 'high' in risk_lower:
-                    result['Risk'] = 'High'
-                elif 'medium' in risk_lower:
-                    result['Risk'] = 'Medium'
-                else:
-                    result['Risk'] = 'Low'
+            logger.info("Calling OpenAI API with model: %s for daily analysis %s", self.model, date)
+            async with semaphore:
+                for attempt in range(OPENAI_RATE_LIMIT_RETRIES + 1):
+                    try:
+                        response = await client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            max_completion_tokens=1000
+                        )
+                        break
+                    except openai.RateLimitError:
+                        # Back off and retry so one 429 doesn't fail the day's analysis
+                        if attempt == OPENAI_RATE_LIMIT_RETRIES:
+                            raise
+                        await asyncio.sleep(2 ** attempt)
             
-                            # If no structured parsing worked, try to extract from the full text
-                if not result['Key insights'] and not result['Signal'] and not result['Risk']:
-                    # Fallback: look for patterns in the text
-                    text_lower = analysis_text.lower()
-                    if 'positive' in text_lower:
-                        result['Signal'] = 'Positive'
-                    elif 'negative' in text_lower:
-                        result['Signal'] = 'Negative'
-                    else:
-                        result['Signal'] = 'Neutral'
-                        
-                    if 'high' in text_lower and 'risk' in text_lower:
-                        result['Risk'] = 'High'
-                    elif 'medium' in text_lower and 'risk' in text_lower:
-                        result['Risk'] = 'Medium'
-                    else:
-                        result['Risk'] = 'Low'
-                        
-                    # Extract a summary from the text
-                    sentences = analysis_text.split('.')
-                    if sentences:
-                        result['Key insights'] = sentences[0][:200] + "..." if len(sentences[0]) > 200 else sentences[0]
-                
-                # Additional fallback parsing for Signal and Risk if they're still empty
-                if not result['Signal'] or result['Signal'] == '' or not result['Risk'] or result['Risk'] == '':
-                    text_lower = analysis_text.lower()
-                    logger.info(f"Fallback parsing - Signal: {result['Signal']}, Risk: {result['Risk']}")
-                    logger.info(f"Looking for patterns in text: {text_lower[-200:]}")  # Last 200 chars
-                    
-                    # Extract Signal - look for the specific patterns in the AI response
-                    if not result['Signal']:
-                        if '🟢 positive' in text_lower or 'signal: 🟢 positive' in text_lower:
-                            result['Signal'] = 'Positive'
-                            logger.info("Found 🟢 Positive signal")
-                        elif '🔴 negative' in text_lower or 'signal: 🔴 negative' in text_lower:
-                            result['Signal'] = 'Negative'
-                            logger.info("Found 🔴 Negative signal")
-                        elif 'positive' in text_lower and 'signal:' in text_lower:
-                            result['Signal'] = 'Positive'
-                            logger.info("Found Positive signal")
-                        elif 'negative' in text_lower and 'signal:' in text_lower:
-                            result['Signal'] = 'Negative'
-                            logger.info("Found Negative signal")
-                        else:
-                            result['Signal'] = 'Neutral'
-                            logger.info("Defaulting to Neutral signal")
-                    
-                    # Extract Risk - look for the specific patterns in the AI response
-                    if not result['Risk']:
-                        if 'risk: high' in text_lower or ('high' in text_lower and 'risk' in text_lower):
-                            result['Risk'] = 'High'
-                            logger.info("Found High risk")
-                        elif 'risk: medium' in text_lower or ('medium' in text_lower and 'risk' in text_lower):
-                            result['Risk'] = 'Medium'
-                            logger.info("Found Medium risk")
-                        elif 'risk: low' in text_lower or ('low' in text_lower and 'risk' in text_lower):
-                            result['Risk'] = 'Low'
-                            logger.info("Found Low risk")
-                        else:
-                            result['Risk'] = 'Low'
-                            logger.info("Defaulting to Low risk")
+            analysis_text = response.choices[0].message.content
+            if response.usage:
+                # cached_tokens shows how much of the shared system prefix was served from cache
+                prompt_details = getattr(response.usage, 'prompt_tokens_details', None)
+                logger.info("Prompt tokens for %s: %d (%d cached)", date, response.usage.prompt_tokens,
+                            getattr(prompt_details, 'cached_tokens', None) or 0)
             
-            # Final cleanup for key insights - handle case where AI includes headers
-            if result['Key insights']:
-                # If the key insights still contain headers, try to extract just the content
-                insights_text = result['Key insights']
-                
-                # Remove any date lines first
-                lines = insights_text.split('\n')
-                filtered_lines = []
-                for line in lines:
-                    line = line.strip()
-                    if line and not line.lower().startswith('date:'):
-                        filtered_lines.append(line)
-                insights_text = ' '.join(filtered_lines)
-                
-                # Remove any remaining "key insights:" prefix
-                if 'key insights:' in insights_text.lower():
-                    parts = insights_text.split('key insights:')
-                    if len(parts) > 1:
-                        result['Key insights'] = parts[1].strip()
-                    else:
-                        result['Key insights'] = insights_text.strip()
-                else:
-                    result['Key insights'] = insights_text.strip()
-                
-                # Final cleanup to remove any remaining "Key insights:" prefix
-                result['Key insights'] = result['Key insights'].replace('Key insights:', '').replace('key insights:', '').strip()
-                
-                # Limit to 200 words but preserve more meaningful content
-                words = result['Key insights'].split()
-                if len(words) > 200:
-                    # Try to find a good breaking point (end of sentence)
-                    truncated = ' '.join(words[:200])
-                    # Look for the last complete sentence
-                    sentences = truncated.split('.')
-                    if len(sentences) > 1:
-                        # Remove the last incomplete sentence
-                        complete_sentences = sentences[:-1]
-                        result['Key insights'] = '. '.join(complete_sentences) + '.'
-                    else:
-                        result['Key insights'] = truncated + '...'
-                else:
-                    result['Key insights'] = ' '.join(words)
+            if not analysis_text:
+                logger.warning("Empty response from OpenAI API for daily analysis %s", date)
+                return "Unable to generate analysis due to insufficient data."
+            logger.info("Response length for %s: %d characters", date, len(analysis_text))
+            logger.debug("Raw AI response for daily analysis %s: %s", date, analysis_text)
+            self.cache.set(cache_key, analysis_text)
+            return analysis_text
             
-            # Final fallback parsing for Signal and Risk if they're still empty
-            if not result['Signal'] or result['Signal'] == '' or not result['Risk'] or result['Risk'] == '':
-                text_lower = analysis_text.lower()
-                
-                # Extract Signal - look for the specific patterns in the AI response
-                if not result['Signal'] or result['Signal'] == '':
-                    if '🟢 positive' in text_lower or 'signal: 🟢 positive' in text_lower:
-                        result['Signal'] = 'Positive'
-                    elif '🔴 negative' in text_lower or 'signal: 🔴 negative' in text_lower:
-                        result['Signal'] = 'Negative'
-                    elif 'positive' in text_lower and 'signal:' in text_lower:
-                        result['Signal'] = 'Positive'
-                    elif 'negative' in text_lower and 'signal:' in text_lower:
-                        result['Signal'] = 'Negative'
-                    else:
-                        result['Signal'] = 'Neutral'
-                
-                # Extract Risk - look for the specific patterns in the AI response
-                if not result['Risk'] or result['Risk'] == '':
-                    if 'risk: high' in text_lower or ('high' in text_lower and 'risk' in text_lower):
-                        result['Risk'] = 'High'
-                    elif 'risk: medium' in text_lower or ('medium' in text_lower and 'risk' in text_lower):
-                        result['Risk'] = 'Medium'
-                    elif 'risk: low' in text_lower or ('low' in text_lower and 'risk' in text_lower):
-                        result['Risk'] = 'Low'
-                    else:
-                        result['Risk'] = 'Low'
+        except openai.BadRequestError as e:
+            logger.error("Invalid model request for daily analysis %s: %s", date, e)
+            return f"Model configuration error: {str(e)}. Please check OPENAI_MODEL setting."
+        except openai.AuthenticationError as e:
+            logger.error("Authentication error for daily analysis %s: %s", date, e)
+            return f"Authentication error: {str(e)}. Please check OPENAI_API_KEY."
+        except Exception as e:
+            logger.error("Error calling OpenAI API for daily analysis %s: %s", date, e)
+            return f"Error in AI analysis: {str(e)}"
+    
+    def _run_batch(self, pending_requests: Dict[str, Tuple[List[Dict[str, str]], str]]) -> Dict[str, str]:
+        """Submit the daily requests as one Batch API job and return the responses that completed"""
+        lines = [
+            json.dumps({
+                'custom_id': date,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {'model': self.model, 'messages': messages, 'max_completion_tokens': 1000}
+            })
+            for date, (messages, _) in pending_requests.items()
+        ]
+        try:
+            batch_file = self.client.files.create(
+                file=('infineon_analysis_batch.jsonl', '\n'.join(lines).encode('utf-8')),
+                purpose='batch'
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window='24h'
+            )
+            logger.info("Submitted OpenAI batch %s with %d requests", batch.id, len(lines))
             
-            logger.info(f"Parsed result for {source}: {result}")
-            return result
+            # Batches usually finish in minutes but may take up to the completion window
+            delay = 5
+            while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                time.sleep(delay)
+                delay = min(delay * 2, 300)
+                batch = self.client.batches.retrieve(batch.id)
             
-        except Exception as e:
-            logger.error(f"Error parsing analysis: {e}")
-            return {
-                'Date': datetime.now().strftime('%Y-%m-%d'),
-                'Source': source,
-                'Key insights': 'Analysis parsing error',
-                'Signal': 'Neutral',
-                'Risk': 'Low'
-            }
+            if batch.status != 'completed' or not batch.output_file_id:
+                logger.warning("OpenAI batch %s ended with status %s", batch.id, batch.status)
+                return {}
+            output = self.client.files.content(batch.output_file_id).text
+        except openai.OpenAIError as e:
+            logger.warning("OpenAI batch request failed, falling back to direct calls: %s", e)
+            return {}
+        
+        # Each output line is handled on its own; a date whose line is malformed or
+        # failed is left out, so it goes through the direct path instead
+        analysis_texts = {}
+        for line in output.splitlines():
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+                date = item.get('custom_id')
+                response = item.get('response') or {}
+                if response.get('status_code') != 200:
+                    logger.warning("Batch request for %s failed: %s", date, item.get('error'))
+                    continue
+                if date not in pending_requests:
+                    logger.warning("Ignoring batch output for unknown request %r", date)
+                    continue
+                analysis_text = response['body']['choices'][0]['message']['content']
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                logger.warning("Skipping malformed batch output line: %s (%.200s)", e, line)
+                continue
+            if analysis_text:
+                analysis_texts[date] = analysis_text
+                self.cache.set(pending_requests[date][1], analysis_text)
+        logger.info("OpenAI batch %s returned %d of %d responses", batch.id, len(analysis_texts), len(lines))
+        return analysis_texts
+    
+    def _parse_analysis(self, analysis_text: str, source: str) -> Dict[str, Any]:
+        """Parse AI analysis into structured format"""
+        # Identical responses (e.g. LLM cache hits) reuse the earlier parse; the copy keeps
+        # callers from mutating the cached dict
+        return dict(_parse_analysis_cached(analysis_text, source, datetime.now().strftime('%Y-%m-%d')))
+
+# Header styles for the exports, built once rather than on every export
+EXCEL_HEADER_FORMAT = {
+    'bold': True,
+    'font_color': '#FFFFFF',
+    'bg_color': '#366092',
+    'align': 'center'
+}
+SHEETS_HEADER_FORMAT = {
+    'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.6},
+    'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+}
 
 class ExcelIntelligenceExporter:
     """Export competitive intelligence to Excel with specified format"""
@@ -941,48 +1146,35 @@ class ExcelIntelligenceExporter:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             excel_filename = f'exports/infineon_intelligence_{timestamp}.xlsx'
             
-            # Create DataFrame with required columns
-            df = pd.DataFrame(analysis_results)
+            # Required columns in order (Source is not exported); rows are built directly
+            # from the result dicts, which are only a handful per run
+            columns = ['Date', 'Key insights', 'Signal', 'Risk']
+            rows = [[result.get(col, '') for col in columns] for result in analysis_results]
             
-            # Ensure required columns exist
-            required_columns = ['Date', 'Key insights', 'Signal', 'Risk']
-            for col in required_columns:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            # Reorder columns as specified (removed Source column)
-            df = df[['Date', 'Key insights', 'Signal', 'Risk']]
+            # Work out column widths from the header and cell text up front, since
+            # constant_memory mode streams each row to disk as soon as it is complete
+            column_widths = [
+                min(max([len(col)] + [len(str(row[col_idx])) for row in rows]) + 2, 50)
+                for col_idx, col in enumerate(columns)
+            ]
             
-            # Create Excel writer with formatting
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Competitive Intelligence', index=False)
+            # Stream rows with xlsxwriter in constant_memory mode, which requires them
+            # to be written in order
+            workbook = xlsxwriter.Workbook(excel_filename, {'constant_memory': True})
+            try:
+                worksheet = workbook.add_worksheet('Competitive Intelligence')
                 
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Competitive Intelligence']
+                for col_idx, width in enumerate(column_widths):
+                    worksheet.set_column(col_idx, col_idx, width)
                 
                 # Format headers
-                from openpyxl.styles import Font, PatternFill, Alignment
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+                header_format = workbook.add_format(EXCEL_HEADER_FORMAT)
+                worksheet.write_row(0, 0, columns, header_format)
                 
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal="center")
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                for row_idx, row in enumerate(rows, start=1):
+                    worksheet.write_row(row_idx, 0, row)
+            finally:
+                workbook.close()
             
             logger.info(f"Competitive intelligence exported to Excel: {excel_filename}")
             return excel_filename
@@ -1002,6 +1194,7 @@ class GoogleSheetsIntelligenceExporter:
         self.credentials_file = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
         self.spreadsheet_id = os.getenv('GOOGLE_SPREADSHEET_ID') or os.getenv('SPREADSHEET_ID')
         self.client = None
+        self.spreadsheet = None  # handle from create_or_open_spreadsheet, reused by exports
         
     def authenticate(self):
         """Authenticate with Google Sheets API"""
@@ -1034,11 +1227,16 @@ class GoogleSheetsIntelligenceExporter:
                 if not self.authenticate():
                     return None
             
+            # Reuse the spreadsheet already opened in this process
+            if self.spreadsheet:
+                return self.spreadsheet.url
+            
             # Use provided spreadsheet ID if available
             if self.spreadsheet_id:
                 try:
                     spreadsheet = self.client.open_by_key(self.spreadsheet_id)
                     logger.info(f"Opened existing spreadsheet: {spreadsheet.title}")
+                    self.spreadsheet = spreadsheet
                     return spreadsheet.url
                 except Exception as e:
                     logger.warning(f"Could not open spreadsheet with ID {self.spreadsheet_id}: {e}")
@@ -1055,6 +1253,7 @@ class GoogleSheetsIntelligenceExporter:
             logger.info(f"Spreadsheet ID: {spreadsheet.id}")
             logger.info("💡 Save this ID in your .env file as GOOGLE_SPREADSHEET_ID for future use")
             
+            self.spreadsheet = spreadsheet
             return spreadsheet.url
             
         except Exception as e:
@@ -1073,18 +1272,12 @@ class GoogleSheetsIntelligenceExporter:
             if not spreadsheet_url:
                 raise Exception("Failed to create or open spreadsheet")
             
-            # Get the spreadsheet
-            if self.spreadsheet_id:
-                spreadsheet = self.client.open_by_key(self.spreadsheet_id)
-            else:
-                # Get the most recently created spreadsheet
-                spreadsheets = self.client.openall()
-                spreadsheet = spreadsheets[0]  # Most recent
+            # Use the handle opened or created above instead of fetching it again
+            spreadsheet = self.spreadsheet
             
-            # Create or clear the main worksheet
+            # Open or create the main worksheet; clearing happens in the batch below
             try:
                 worksheet = spreadsheet.worksheet('Competitive Intelligence')
-                worksheet.clear()
             except:
                 worksheet = spreadsheet.add_worksheet(title='Competitive Intelligence', rows=100, cols=10)
             
@@ -1101,14 +1294,27 @@ class GoogleSheetsIntelligenceExporter:
                 ]
                 data.append(row)
             
-            # Update the worksheet
-            worksheet.update('A1:D' + str(len(data)), data)
-            
-            # Format headers (basic formatting)
-            worksheet.format('A1:D1', {
-                'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.6},
-                'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-            })
+            # Clear old values, write the new rows and format the header in one request
+            spreadsheet.batch_update({'requests': [
+                {'updateCells': {
+                    'range': {'sheetId': worksheet.id},
+                    'fields': 'userEnteredValue'
+                }},
+                {'updateCells': {
+                    'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+                    'rows': [
+                        {'values': [{'userEnteredValue': {'stringValue': str(value)}} for value in row]}
+                        for row in data
+                    ],
+                    'fields': 'userEnteredValue'
+                }},
+                {'repeatCell': {
+                    'range': {'sheetId': worksheet.id, 'startRowIndex': 0, 'endRowIndex': 1,
+                              'startColumnIndex': 0, 'endColumnIndex': len(headers)},
+                    'cell': {'userEnteredFormat': SHEETS_HEADER_FORMAT},
+                    'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+                }}
+            ]})
             
             logger.info(f"Successfully exported to Google Sheets: {spreadsheet_url}")
             return spreadsheet_url
@@ -1118,6 +1324,34 @@ class GoogleSheetsIntelligenceExporter:
             raise
 
 
+def export_to_google_sheets(analysis_results: List[Dict[str, Any]]):
+    """Export to Google Sheets when available; return the sheet URL, or None if skipped or failed"""
+    try:
+        if GOOGLE_SHEETS_AVAILABLE:
+            sheets_exporter = GoogleSheetsIntelligenceExporter()
+            google_sheets_url = sheets_exporter.export_to_sheets(analysis_results)
+            logger.info(f"Successfully exported to Google Sheets: {google_sheets_url}")
+            return google_sheets_url
+        logger.info("Google Sheets export skipped - dependencies not installed")
+    except Exception as e:
+        logger.warning(f"Google Sheets export failed: {e}")
+    return None
+
+def write_analysis_summary(analysis_results: List[Dict[str, Any]], analysis_file: str):
+    """Write the plain-text analysis summary"""
+    lines = [
+        "INFINEON COMPETITIVE INTELLIGENCE ANALYSIS\n",
+        "=" * 60 + "\n\n",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ]
+    for result in analysis_results:
+        lines.append(f"Date: {result.get('Date', '')}\n")
+        lines.append(f"Signal: {result.get('Signal', '')}\n")
+        lines.append(f"Risk: {result.get('Risk', '')}\n")
+        lines.append(f"Key Insights: {result.get('Key insights', '')}\n")
+        lines.append("-" * 40 + "\n\n")
+    write_atomic(analysis_file, ''.join(lines).encode('utf-8'))
+
 def main():
     """Main function for Infineon competitive intelligence analysis"""
     logger.info("Starting Infineon Competitive Intelligence Analysis")
@@ -1133,44 +1367,36 @@ def main():
         # Step 3: Save raw data
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         raw_data_file = f'data/infineon_intelligence_raw_{timestamp}.json'
-        with open(raw_data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        compress = os.getenv('COMPRESS_RAW_DATA', 'false').lower() in ('1', 'true', 'yes')
+        if compress and not ZSTD_AVAILABLE:
+            logger.warning("COMPRESS_RAW_DATA is set but zstandard is not installed; writing plain JSON")
+        if compress and ZSTD_AVAILABLE:
+            # Archived copies are rarely read by hand, so skip the indentation and compress
+            raw_data_file += '.zst'
+            write_atomic(raw_data_file, zstandard.ZstdCompressor(level=3).compress(dump_json_bytes(data)))
+        else:
+            write_atomic(raw_data_file, dump_json_bytes(data, indent=True))
         logger.info(f"Raw intelligence data saved to {raw_data_file}")
         
         # Step 4: AI Analysis using Infineon framework (one row per day)
         analyzer = InfineonIntelligenceAnalyzer()
         analysis_results = analyzer.analyze_for_infineon(data)
         
-        # Step 5: Export to Excel
-        exporter = ExcelIntelligenceExporter()
-        excel_file = exporter.export_to_excel(analysis_results)
-        
-        # Step 5b: Export to Google Sheets (optional)
-        google_sheets_url = None
-        try:
-            if GOOGLE_SHEETS_AVAILABLE:
-                sheets_exporter = GoogleSheetsIntelligenceExporter()
-                google_sheets_url = sheets_exporter.export_to_sheets(analysis_results)
-                logger.info(f"Successfully exported to Google Sheets: {google_sheets_url}")
-            else:
-                logger.info("Google Sheets export skipped - dependencies not installed")
-        except Exception as e:
-            logger.warning(f"Google Sheets export failed: {e}")
-            logger.info("Excel export completed successfully")
-        
-        # Step 6: Save analysis summary
+        # Steps 5, 5b and 6 share no state, so the Excel export, the Google Sheets
+        # upload and the analysis summary run side by side, overlapping the
+        # network-bound upload with the local file writes
         analysis_file = f'analysis/infineon_analysis_{timestamp}.txt'
-        with open(analysis_file, 'w') as f:
-            f.write("INFINEON COMPETITIVE INTELLIGENCE ANALYSIS\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 5: Export to Excel
+            excel_future = executor.submit(ExcelIntelligenceExporter().export_to_excel, analysis_results)
+            # Step 5b: Export to Google Sheets (optional)
+            sheets_future = executor.submit(export_to_google_sheets, analysis_results)
+            # Step 6: Save analysis summary
+            summary_future = executor.submit(write_analysis_summary, analysis_results, analysis_file)
             
-            for result in analysis_results:
-                f.write(f"Date: {result.get('Date', '')}\n")
-                f.write(f"Signal: {result.get('Signal', '')}\n")
-                f.write(f"Risk: {result.get('Risk', '')}\n")
-                f.write(f"Key Insights: {result.get('Key insights', '')}\n")
-                f.write("-" * 40 + "\n\n")
+            excel_file = excel_future.result()
+            google_sheets_url = sheets_future.result()
+            summary_future.result()
         
         logger.info("=" * 60)
         logger.info("INFINEON COMPETITIVE INTELLIGENCE COMPLETED")
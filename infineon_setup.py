@@ -11,6 +11,13 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+# Installed-version lookup (Python 3.8+); without it every package is reinstalled
+try:
+    from importlib.metadata import version, PackageNotFoundError
+    METADATA_AVAILABLE = True
+except ImportError:
+    METADATA_AVAILABLE = False
+
 def print_banner():
     """Print setup banner"""
     print("=" * 60)
@@ -46,28 +53,45 @@ def create_directories():
     
     print("✅ Directory structure created")
 
+def needs_install(requirement):
+    """Check whether a pinned 'name==version' requirement is missing or at another version"""
+    if not METADATA_AVAILABLE:
+        return True
+    name, _, pinned = requirement.partition('==')
+    try:
+        return version(name) != pinned
+    except PackageNotFoundError:
+        return True
+
 def install_dependencies():
     """Install required Python packages"""
     print("📦 Installing dependencies...")
     
     requirements = [
         'requests==2.31.0',
-        'beautifulsoup4==4.12.2', 
         'pandas==2.1.4',
-        'openai==0.28.1',
+        'openai==1.51.0',
+        'httpx==0.27.2',
         'python-dotenv==1.0.0',
         'lxml==4.9.3',
-        'openpyxl==3.1.2'
+        'xlsxwriter==3.1.9',
+        'orjson==3.9.10'
     ]
     
-    for package in requirements:
-        try:
-            print(f"   Installing {package}...")
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-            print(f"   ✅ {package} installed")
-        except subprocess.CalledProcessError as e:
-            print(f"   ❌ Failed to install {package}: {e}")
-            return False
+    # Re-runs skip pip entirely when every pin is already satisfied
+    missing = [requirement for requirement in requirements if needs_install(requirement)]
+    if not missing:
+        print("✅ All dependencies already installed")
+        return True
+    
+    # One pip invocation resolves the whole set in a single pass; prefer wheels so
+    # lxml and pandas are not built from source
+    try:
+        print(f"   Installing {', '.join(missing)}...")
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--prefer-binary', *missing])
+    except subprocess.CalledProcessError as e:
+        print(f"   ❌ Failed to install dependencies: {e}")
+        return False
     
     print("✅ All dependencies installed")
     return True
@@ -88,6 +112,20 @@ SCRAPING_DELAY=2
 # Optional: OpenAI model to use
 OPENAI_MODEL=gpt-3.5-turbo
 
+# Optional: Send the daily analysis through the OpenAI Batch API
+# (half the token price, but results can take up to 24 hours)
+OPENAI_BATCH=false
+
+# Optional: Store raw scraped data as zstd-compressed .json.zst (needs zstandard)
+COMPRESS_RAW_DATA=false
+
+# Optional: Directory for cached AI responses (reused when the inputs repeat)
+LLM_CACHE_DIR=data/llm_cache
+
+# Optional: Reuse an earlier AI response when a day's inputs are this similar to
+# earlier ones (cosine similarity, e.g. 0.90); unset to disable. Needs numpy.
+# SEMANTIC_CACHE_THRESHOLD=0.90
+
 # Optional: Custom title prefix for exports
 SHEETS_TITLE_PREFIX=Infineon Intelligence
 """
@@ -104,11 +142,11 @@ def test_imports():
     
     packages = [
         'requests',
-        'bs4',
+        'lxml',
         'pandas', 
         'openai',
         'dotenv',
-        'openpyxl'
+        'xlsxwriter'
     ]
     
     for package in packages:
@@ -3,33 +3,38 @@
 Configuration file for Infineon Intelligence Sources
 """
 
-def get_enabled_sources():
-    """Return the enabled intelligence sources"""
-    return {
-        'canary': {
-            'name': 'Canary Media',
-            'url': 'https://www.canarymedia.com/',
-            'description': 'Clean energy news and analysis',
-            'enabled': True
-        },
-        'industryweek': {
-            'name': 'Industry Week',
-            'url': 'https://www.industryweek.com/',
-            'description': 'Manufacturing and industrial insights',
-            'enabled': True
-        },
-        'eia': {
-            'name': 'EIA Today in Energy',
-            'url': 'https://www.eia.gov/todayinenergy/',
-            'description': 'U.S. Energy Information Administration daily energy insights',
-            'enabled': True
-        }
+from functools import lru_cache
+from types import MappingProxyType
+
+_SOURCES = {
+    'canary': {
+        'name': 'Canary Media',
+        'url': 'https://www.canarymedia.com/',
+        'description': 'Clean energy news and analysis',
+        'enabled': True
+    },
+    'industryweek': {
+        'name': 'Industry Week',
+        'url': 'https://www.industryweek.com/',
+        'description': 'Manufacturing and industrial insights',
+        'enabled': True
+    },
+    'eia': {
+        'name': 'EIA Today in Energy',
+        'url': 'https://www.eia.gov/todayinenergy/',
+        'description': 'U.S. Energy Information Administration daily energy insights',
+        'enabled': True
     }
+}
+
+@lru_cache(maxsize=1)
+def get_enabled_sources():
+    """Return the enabled intelligence sources as a read-only mapping, built once"""
+    return MappingProxyType({key: MappingProxyType(source) for key, source in _SOURCES.items()})
 
 def get_source_by_key(key):
     """Get a specific source by its key"""
-    sources = get_enabled_sources()
-    return sources.get(key)
+    return get_enabled_sources().get(key)
 
 def is_source_enabled(key):
     """Check if a source is enabled"""
@@ -4,9 +4,7 @@ Infineon Competitive Intelligence Scheduler
 Runs the main intelligence scraper at specified intervals
 """
 
-import schedule
-import time
-import subprocess
+from apscheduler.schedulers.blocking import BlockingScheduler
 import sys
 import os
 import logging
@@ -14,25 +12,29 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 
+# Scheduler process start time, used to name its log file
+RUN_TIMESTAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+# One formatter shared by the file and console handlers
+LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
 # Setup logging for the scheduler
 def setup_scheduler_logging():
     """Setup logging for the scheduler"""
     os.makedirs('logs', exist_ok=True)
     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_filename = f'logs/scheduler_{timestamp}.log'
+    log_filename = f'logs/scheduler_{RUN_TIMESTAMP}.log'
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename),
-            logging.StreamHandler()
-        ]
-    )
+    handlers = [
+        logging.FileHandler(log_filename),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(LOG_FORMATTER)
+    
+    logging.basicConfig(level=logging.INFO, handlers=handlers)
     return logging.getLogger(__name__)
 
-def run_intelligence_job():
+def run_intelligence_job(batch=False):
     """Run the main intelligence scraper"""
     logger = logging.getLogger(__name__)
     logger.info("=" * 60)
@@ -40,90 +42,72 @@ def run_intelligence_job():
     logger.info("=" * 60)
     
     try:
-        # Get the directory of this script
+        # Outputs, .env and caches are resolved relative to the project directory
         script_dir = Path(__file__).parent.absolute()
+        os.chdir(script_dir)
         
-        # Activate virtual environment and run the main script
-        if os.name == 'nt':  # Windows
-            activate_script = script_dir / "venv" / "Scripts" / "activate.bat"
-            python_exe = script_dir / "venv" / "Scripts" / "python.exe"
-        else:  # Unix/Linux/macOS
-            activate_script = script_dir / "venv" / "bin" / "activate"
-            python_exe = script_dir / "venv" / "bin" / "python"
-        
-        # Check if virtual environment exists
-        if not python_exe.exists():
-            logger.error(f"Virtual environment not found at {python_exe}")
-            logger.error("Please run setup_venv.sh first to create the virtual environment")
-            return False
-        
-        # Run the main intelligence scraper
-        main_script = script_dir / "infineon_intelligence_scraper.py"
+        if batch:
+            # Unattended runs can wait for the OpenAI Batch API, which is billed at half price
+            os.environ['OPENAI_BATCH'] = 'true'
         
-        if not main_script.exists():
-            logger.error(f"Main script not found at {main_script}")
+        # Imported on first use and reused by later ticks, so the interpreter and the
+        # heavy dependencies are loaded once per scheduler process rather than per run.
+        # The scraper's log records go through the scheduler's logging handlers.
+        try:
+            from infineon_intelligence_scraper import main as intelligence_main
+        except ImportError as e:
+            logger.error(f"Could not import the intelligence scraper: {e}")
+            logger.error("Please run setup_venv.sh first and start the scheduler from the virtual environment")
             return False
         
-        logger.info(f"Running intelligence scraper: {main_script}")
-        
-        # Execute the main script
-        result = subprocess.run(
-            [str(python_exe), str(main_script)],
-            capture_output=True,
-            text=True,
-            cwd=script_dir
-        )
-        
-        if result.returncode == 0:
-            logger.info("Intelligence job completed successfully")
-            logger.info("Output:")
-            logger.info(result.stdout)
-            return True
-        else:
-            logger.error(f"Intelligence job failed with return code {result.returncode}")
-            logger.error("Error output:")
-            logger.error(result.stderr)
-            logger.error("Standard output:")
-            logger.error(result.stdout)
-            return False
+        logger.info("Running intelligence scraper")
+        intelligence_main()
+        logger.info("Intelligence job completed successfully")
+        return True
             
     except Exception as e:
         logger.error(f"Error running intelligence job: {e}")
         return False
 
-def setup_schedule(interval_hours=24):
+def setup_schedule(interval_hours=24, batch=False):
     """Setup the schedule for running the intelligence job"""
     logger = logging.getLogger(__name__)
     
-    # Schedule the job to run every X hours
-    schedule.every(interval_hours).hours.do(run_intelligence_job)
+    # Schedule the job to run every X hours. The scheduler sleeps until the next
+    # fire time instead of polling; max_instances=1 keeps a slow run from
+    # overlapping the next one, and coalesce=True folds runs missed while the
+    # machine was asleep into a single catch-up run. misfire_grace_time=None lets
+    # that catch-up run start however late it is (APScheduler otherwise drops
+    # runs more than a second overdue).
+    scheduler = BlockingScheduler()
+    scheduler.add_job(run_intelligence_job, 'interval', hours=interval_hours, args=[batch],
+                      max_instances=1, coalesce=True, misfire_grace_time=None)
     
     logger.info(f"Intelligence job scheduled to run every {interval_hours} hours")
-    logger.info("Available schedule commands:")
-    logger.info("  - schedule.every().hour.do(run_intelligence_job)")
-    logger.info("  - schedule.every().day.at('10:30').do(run_intelligence_job)")
-    logger.info("  - schedule.every().monday.do(run_intelligence_job)")
-    logger.info("  - schedule.every().wednesday.at('13:15').do(run_intelligence_job)")
+    logger.info("Other triggers can be registered with scheduler.add_job, e.g.:")
+    logger.info("  - scheduler.add_job(run_intelligence_job, 'interval', hours=1)")
+    logger.info("  - scheduler.add_job(run_intelligence_job, 'cron', hour=10, minute=30)")
+    logger.info("  - scheduler.add_job(run_intelligence_job, 'cron', day_of_week='mon')")
+    logger.info("  - scheduler.add_job(run_intelligence_job, 'cron', day_of_week='wed', hour=13, minute=15)")
+    return scheduler
 
-def run_scheduler(interval_hours=24, run_once=False):
+def run_scheduler(interval_hours=24, run_once=False, batch=False):
     """Run the scheduler"""
     logger = logging.getLogger(__name__)
     
     if run_once:
         logger.info("Running intelligence job once...")
-        success = run_intelligence_job()
+        success = run_intelligence_job(batch)
         return success
     else:
-        setup_schedule(interval_hours)
+        scheduler = setup_schedule(interval_hours, batch)
         
         logger.info("Scheduler started. Press Ctrl+C to stop.")
         logger.info(f"Next run in {interval_hours} hours")
         
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-        except KeyboardInterrupt:
+            scheduler.start()
+        except (KeyboardInterrupt, SystemExit):
             logger.info("Scheduler stopped by user")
             return True
 
@@ -148,6 +132,9 @@ Examples:
   
   # Run every 8 hours with verbose logging
   python scheduled_intelligence.py --interval 8 --verbose
+  
+  # Run nightly through the OpenAI Batch API (cheaper, slower)
+  python scheduled_intelligence.py --batch
         """
     )
     
@@ -164,6 +151,12 @@ Examples:
         help='Run once and exit (do not schedule)'
     )
     
+    parser.add_argument(
+        '--batch', 
+        action='store_true',
+        help='Submit the AI analysis through the OpenAI Batch API (sets OPENAI_BATCH=true)'
+    )
+    
     parser.add_argument(
         '--verbose', 
         action='store_true',
@@ -183,6 +176,7 @@ Examples:
     logger.info("=" * 60)
     logger.info(f"Interval: {args.interval} hours")
     logger.info(f"Run once: {args.once}")
+    logger.info(f"Batch API: {args.batch}")
     logger.info(f"Verbose: {args.verbose}")
     logger.info("=" * 60)
     
@@ -192,7 +186,7 @@ Examples:
         sys.exit(1)
     
     # Run the scheduler
-    success = run_scheduler(args.interval, args.once)
+    success = run_scheduler(args.interval, args.once, args.batch)
     
     if success:
         logger.info("Scheduler completed successfully")
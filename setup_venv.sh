@@ -92,11 +92,11 @@ warnings.filterwarnings('ignore', category=Warning, module='urllib3')
 print(f'✅ Python path: {sys.executable}')
 try:
     import requests
-    import bs4
+    import lxml
     import pandas
     import openai
     import dotenv
-    import openpyxl
+    import xlsxwriter
     print('✅ All required packages imported successfully')
 except ImportError as e:
     print(f'❌ Import error: {e}')
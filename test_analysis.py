@@ -4,99 +4,171 @@ Test script for the updated Infineon Intelligence Analysis
 Tests the new daily aggregation and analysis framework
 """
 
-import json
+import os
 from datetime import datetime
-from infineon_intelligence_scraper import InfineonIntelligenceAnalyzer
+import pandas as pd
 
-def test_analysis_framework():
-    """Test the updated analysis framework with sample data"""
-    
-    # Sample scraped data structure
-    sample_data = {
-        'scraping_timestamp': datetime.now().isoformat(),
-        'canary': {
-            'source': 'Canary Media',
-            'headlines': [
-                'AI-powered predictive maintenance systems showing 30% efficiency gains in industrial operations',
-                'New government funding for industrial AI and smart manufacturing announced',
-                'Major competitor announces delays in AI chip production for industrial applications'
-            ],
-            'key_insights': [
-                'AI-driven predictive maintenance reducing industrial downtime by 30%',
-                'Federal funding of $3.2B allocated for industrial AI and smart manufacturing',
-                'Production delays expected to last 8-10 months for competitor AI chips'
-            ],
-            'market_signals': [
-                'Growing demand for edge AI processing in industrial equipment',
-                'Increased investment in industrial IoT and smart manufacturing',
-                'Supply chain challenges affecting AI semiconductor production'
-            ]
-        },
-        'industryweek': {
-            'source': 'Industry Week',
-            'headlines': [
-                'Industrial sector embracing hybrid AI models for equipment optimization',
-                'Smart manufacturing driving demand for AI-powered semiconductors',
-                'New regulations for AI deployment in industrial safety systems'
-            ],
-            'key_insights': [
-                'Hybrid AI models becoming standard for industrial equipment optimization',
-                'Industrial motor drives requiring AI-powered predictive maintenance',
-                'AI safety regulations creating new market opportunities for reliable systems'
-            ],
-            'market_signals': [
-                'Technology transition to AI-powered industrial equipment creating new design opportunities',
-                'Industrial sector AI modernization driving semiconductor demand',
-                'Regulatory changes opening new market segments for AI-powered industrial solutions'
-            ]
-        }
+# Keep Numba's compiled-kernel cache in one place so reruns load it instead of
+# recompiling; this has to be set before numba is imported
+os.environ.setdefault('NUMBA_CACHE_DIR',
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)), '.numba_cache'))
+
+# JIT-compiled word counting (optional)
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_ascii_words(buf):
+        """Count runs of non-whitespace bytes in ASCII text"""
+        count = 0
+        in_word = False
+        for b in buf:
+            # The ASCII characters str.split() treats as whitespace
+            is_space = b == 32 or 9 <= b <= 13 or 28 <= b <= 31
+            if not is_space and not in_word:
+                count += 1
+            in_word = not is_space
+        return count
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words, as len(text.split()) would"""
+    if NUMBA_AVAILABLE and text.isascii():
+        return _count_ascii_words(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+    return len(text.split())
+
+# Labels the parser may assign
+_VALID_SIGNALS = frozenset(('Positive', 'Neutral', 'Negative'))
+_VALID_RISKS = frozenset(('Low', 'Medium', 'High'))
+
+# Run start time, shared by the sample data and the results file name
+_RUN_TS = datetime.now()
+_RUN_TAG = _RUN_TS.strftime('%Y%m%d_%H%M%S')
+
+# Sample scraped data structure; the analyzer only reads it, so one copy is shared
+_SAMPLE_DATA = {
+    'scraping_timestamp': _RUN_TS.isoformat(),
+    'canary': {
+        'source': 'Canary Media',
+        'headlines': [
+            'AI-powered predictive maintenance systems showing 30% efficiency gains in industrial operations',
+            'New government funding for industrial AI and smart manufacturing announced',
+            'Major competitor announces delays in AI chip production for industrial applications'
+        ],
+        'key_insights': [
+            'AI-driven predictive maintenance reducing industrial downtime by 30%',
+            'Federal funding of $3.2B allocated for industrial AI and smart manufacturing',
+            'Production delays expected to last 8-10 months for competitor AI chips'
+        ],
+        'market_signals': [
+            'Growing demand for edge AI processing in industrial equipment',
+            'Increased investment in industrial IoT and smart manufacturing',
+            'Supply chain challenges affecting AI semiconductor production'
+        ]
+    },
+    'industryweek': {
+        'source': 'Industry Week',
+        'headlines': [
+            'Industrial sector embracing hybrid AI models for equipment optimization',
+            'Smart manufacturing driving demand for AI-powered semiconductors',
+            'New regulations for AI deployment in industrial safety systems'
+        ],
+        'key_insights': [
+            'Hybrid AI models becoming standard for industrial equipment optimization',
+            'Industrial motor drives requiring AI-powered predictive maintenance',
+            'AI safety regulations creating new market opportunities for reliable systems'
+        ],
+        'market_signals': [
+            'Technology transition to AI-powered industrial equipment creating new design opportunities',
+            'Industrial sector AI modernization driving semiconductor demand',
+            'Regulatory changes opening new market segments for AI-powered industrial solutions'
+        ]
     }
-    
+}
+
+def test_analysis_framework(verbose=False):
+    """Test the updated analysis framework with sample data"""
     print("🧪 Testing Updated Infineon Intelligence Analysis Framework")
     print("=" * 60)
     
     try:
+        # Imported here so collecting this module doesn't load the scraper and its
+        # dependencies, or run its directory and logging setup
+        from infineon_intelligence_scraper import InfineonIntelligenceAnalyzer, dump_json_bytes
+        
         # Initialize analyzer
         analyzer = InfineonIntelligenceAnalyzer()
         print("✅ Analyzer initialized successfully")
         
         # Run analysis
         print("\n📊 Running analysis with daily aggregation...")
-        analysis_results = analyzer.analyze_for_infineon(sample_data)
+        analysis_results = analyzer.analyze_for_infineon(_SAMPLE_DATA)
         
         print(f"\n📈 Analysis completed! Generated {len(analysis_results)} daily analysis entries")
         
         # Display results
-        for i, result in enumerate(analysis_results, 1):
-            print(f"\n--- Daily Analysis #{i} ---")
-            print(f"📅 Date: {result.get('Date', 'N/A')}")
-            print(f"📈 Signal: {result.get('Signal', 'N/A')}")
-            print(f"⚠️  Risk: {result.get('Risk', 'N/A')}")
-            print(f"💡 Key Insights: {result.get('Key insights', 'N/A')}")
-            
-            # Validate format
-            assert result.get('Date'), "Date should be present"
-            assert result.get('Signal') in ['Positive', 'Neutral', 'Negative'], f"Invalid Signal: {result.get('Signal')}"
-            assert result.get('Risk') in ['Low', 'Medium', 'High'], f"Invalid Risk: {result.get('Risk')}"
-            assert result.get('Key insights'), "Key insights should be present"
-            # Check word count instead of character count
-            word_count = len(result.get('Key insights', '').split())
-            assert word_count <= 300, f"Key insights should be 300 words or less (got {word_count} words)"
-            
-            print("✅ Format validation passed")
+        if verbose:
+            # Collect the report and print it in one call
+            lines = []
+            for i, result in enumerate(analysis_results, 1):
+                lines.append(f"\n--- Daily Analysis #{i} ---")
+                lines.append(f"📅 Date: {result.get('Date', 'N/A')}")
+                lines.append(f"📈 Signal: {result.get('Signal', 'N/A')}")
+                lines.append(f"⚠️  Risk: {result.get('Risk', 'N/A')}")
+                lines.append(f"💡 Key Insights: {result.get('Key insights', 'N/A')}")
+            if lines:
+                print('\n'.join(lines))
+        
+        # Validate format column by column across all results
+        df = pd.DataFrame(analysis_results, columns=['Date', 'Signal', 'Risk', 'Key insights']).fillna('')
+        assert df['Date'].ne('').all(), "Date should be present"
+        valid_signals = df['Signal'].isin(_VALID_SIGNALS)
+        assert valid_signals.all(), f"Invalid Signal: {df.loc[~valid_signals, 'Signal'].tolist()}"
+        valid_risks = df['Risk'].isin(_VALID_RISKS)
+        assert valid_risks.all(), f"Invalid Risk: {df.loc[~valid_risks, 'Risk'].tolist()}"
+        assert df['Key insights'].ne('').all(), "Key insights should be present"
+        # Check word count instead of character count
+        word_counts = df['Key insights'].map(count_words)
+        assert (word_counts <= 300).all(), f"Key insights should be 300 words or less (got {word_counts.max()} words)"
+        
+        print("✅ Format validation passed")
         
         print("\n🎉 All tests passed! Analysis framework working correctly.")
         
         # Save test results
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        test_file = f'analysis/test_analysis_results_{timestamp}.json'
-        with open(test_file, 'w') as f:
-            json.dump(analysis_results, f, indent=2)
+        test_file = f'analysis/test_analysis_results_{_RUN_TAG}.jsonl'
+        # One compact JSON object per line, encoded first (with orjson when available)
+        # and written once
+        payload = b''.join(dump_json_bytes(result) + b'\n' for result in analysis_results)
+        with open(test_file, 'wb') as f:
+            f.write(payload)
         print(f"💾 Test results saved to: {test_file}")
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
         raise
 
+def test_signal_risk_fallback():
+    """Without Signal/Risk sections, only labelled mentions in the response set the labels"""
+    from infineon_intelligence_scraper import _parse_analysis_cached
+    
+    # Bare keywords elsewhere in the text must not decide the labels
+    result = _parse_analysis_cached(
+        "Key insights: Positive demand, but no change to highlights.", 'Test', '2025-01-01')
+    assert result['Signal'] == 'Neutral', f"Invalid Signal: {result['Signal']}"
+    assert result['Risk'] == 'Low', f"Invalid Risk: {result['Risk']}"
+    
+    # Labels the section headers miss (e.g. markdown bold) are still picked up
+    result = _parse_analysis_cached(
+        "Key insights: Demand is rising.\n**Signal:** 🔴 Negative\n**Risk:** High - new rivals", 'Test', '2025-01-01')
+    assert result['Signal'] == 'Negative', f"Invalid Signal: {result['Signal']}"
+    assert result['Risk'] == 'High', f"Invalid Risk: {result['Risk']}"
+    print("✅ Signal/Risk fallback test passed")
+
 if __name__ == "__main__":
-    test_analysis_framework()
+    test_signal_risk_fallback()
+    test_analysis_framework(verbose=True)
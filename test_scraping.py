@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the Infineon Intelligence scraper
+Scrapes a local page through the scraper's HTTP session, including its on-disk cache
+"""
+
+import gzip
+import os
+import tempfile
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# A small news page in the shape the scraper looks for, served gzip-encoded like
+# most real sources
+_PAGE = gzip.compress(b"""<html><body>
+<article>
+  <h2>Industrial AI chip demand rises sharply this quarter</h2>
+  <p>Shipments of industrial AI processors grew 30% in 2024 across European factories.</p>
+</article>
+<article>
+  <h2>Smart manufacturing investment reaches a new record high</h2>
+  <p>Investment in smart manufacturing rose 18% to $4.2B as automation demand increased.</p>
+</article>
+</body></html>""")
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Serve _PAGE and count the requests that reach the server"""
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(_PAGE)))
+        self.end_headers()
+        self.wfile.write(_PAGE)
+
+    def log_message(self, format, *args):
+        pass
+
+def test_cached_scraping():
+    """Scrape a local page twice; both parse, and the second comes from the HTTP cache"""
+    print("🧪 Testing scraping through the HTTP cache")
+    print("=" * 60)
+
+    server = HTTPServer(('127.0.0.1', 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    previous_dir = os.getcwd()
+    # The scraper keeps its cache and logs relative to the working directory
+    os.chdir(tempfile.mkdtemp())
+    try:
+        from infineon_intelligence_scraper import (
+            ConfigurableIntelligenceScraper, SOURCE_CONFIGS, HTTP_CACHE_AVAILABLE
+        )
+        if not HTTP_CACHE_AVAILABLE:
+            print("⚠️  requests-cache not installed; skipping")
+            return
+
+        config = dict(SOURCE_CONFIGS['canary'])
+        config['urls'] = [f'http://127.0.0.1:{server.server_port}/news']
+        scraper = ConfigurableIntelligenceScraper()
+
+        _PageHandler.hits = 0
+        first = scraper._scrape_generic(config)
+        second = scraper._scrape_generic(config)
+
+        assert first['headlines'], f"No headlines scraped: {first}"
+        assert second == {**first, 'timestamp': second['timestamp']}, "Cached scrape differs from the first"
+        assert _PageHandler.hits == 1, f"Expected the second scrape to come from the cache ({_PageHandler.hits} requests)"
+        print("✅ Cached scraping test passed")
+    finally:
+        os.chdir(previous_dir)
+        server.shutdown()
+        server.server_close()
+
+def test_overlapping_keywords():
+    """Keywords that are a prefix of another keyword are still reported"""
+    from infineon_intelligence_scraper import (
+        compile_keyword_pattern, find_keywords, match_signal_sentences
+    )
+
+    keywords = ['solar', 'solar power', 'power']
+    pattern = compile_keyword_pattern(keywords)
+    assert find_keywords('new solar power plants', keywords, pattern) == set(keywords)
+
+    sentence = 'Solar power capacity additions doubled in 2024.'
+    matches = match_signal_sentences([sentence], [sentence.lower()], keywords, pattern)
+    assert matches == [sentence] * 3, f"Expected a match for every keyword: {matches}"
+    print("✅ Overlapping keyword test passed")
+
+if __name__ == "__main__":
+    test_cached_scraping()
+    test_overlapping_keywords()